@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Request, Query
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, Query
 from fastapi.responses import JSONResponse, PlainTextResponse
 from typing import Optional, List
 import json
@@ -183,9 +183,9 @@ async def get_signals():
 @router.post("/generate")
 async def generate_report():
     """Trigger a new narrative detection run (non-blocking)"""
-    from main import _pipeline_lock, run_pipeline_task
+    from main import _pipeline_running, run_pipeline_task
 
-    if _pipeline_lock.locked():
+    if _pipeline_running:
         return {"status": "already_running", "eta_seconds": 15}
 
     asyncio.create_task(run_pipeline_task())
@@ -219,8 +219,8 @@ async def get_status():
 async def get_stats():
     """Get agent tracking statistics"""
     try:
-        from engine.store import get_stats as db_stats
-        stats = db_stats()
+        from engine.store import get_stats_async
+        stats = await get_stats_async()
         return {"agent": "autonomous", "loop_hours": 2, **stats}
     except Exception as e:
         return {"error": str(e)}
@@ -230,8 +230,8 @@ async def get_stats():
 async def get_velocity(topic: str, days: int = 7):
     """Get signal velocity for a specific topic"""
     try:
-        from engine.store import get_signal_velocity
-        return get_signal_velocity(topic, days)
+        from engine.store import get_signal_velocity_async
+        return await get_signal_velocity_async(topic, days)
     except Exception as e:
         return {"error": str(e)}
 
@@ -244,47 +244,54 @@ def _load_status():
         return {}
 
 
+def _query_history(days: int) -> dict:
+    """Blocking per-day signal/narrative counts; run via a worker thread."""
+    from engine.store import get_db
+    conn = get_db()
+    try:
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+        # date() buckets by UTC day: SQLite stores UTC ISO text and the
+        # Postgres pool pins its sessions to timezone=UTC
+        rows = conn.execute("""
+            SELECT date(collected_at) as day, COUNT(*) as signal_count,
+                   COUNT(DISTINCT source) as source_count
+            FROM signals
+            WHERE collected_at > ?
+            GROUP BY date(collected_at)
+            ORDER BY day
+        """, (cutoff,)).fetchall()
+
+        narrative_rows = conn.execute("""
+            SELECT date(generated_at) as day, COUNT(*) as narrative_count
+            FROM narratives
+            WHERE generated_at > ?
+            GROUP BY date(generated_at)
+            ORDER BY day
+        """, (cutoff,)).fetchall()
+
+        narrative_map = {str(r["day"]): r["narrative_count"] for r in narrative_rows}
+
+        return {
+            "days": days,
+            "history": [
+                {
+                    "date": str(r["day"]),
+                    "signal_count": r["signal_count"],
+                    "source_count": r["source_count"],
+                    "narrative_count": narrative_map.get(str(r["day"]), 0),
+                }
+                for r in rows
+            ],
+        }
+    finally:
+        conn.close()
+
+
 @router.get("/history")
 async def get_history(days: int = 30):
     """Get signal counts per day for the last N days"""
     try:
-        from engine.store import get_db
-        conn = get_db()
-        try:
-            cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
-            rows = conn.execute("""
-                SELECT date(collected_at) as day, COUNT(*) as signal_count,
-                       COUNT(DISTINCT source) as source_count
-                FROM signals
-                WHERE collected_at > ?
-                GROUP BY date(collected_at)
-                ORDER BY day
-            """, (cutoff,)).fetchall()
-
-            narrative_rows = conn.execute("""
-                SELECT date(generated_at) as day, COUNT(*) as narrative_count
-                FROM narratives
-                WHERE generated_at > ?
-                GROUP BY date(generated_at)
-                ORDER BY day
-            """, (cutoff,)).fetchall()
-
-            narrative_map = {str(r["day"]): r["narrative_count"] for r in narrative_rows}
-
-            return {
-                "days": days,
-                "history": [
-                    {
-                        "date": str(r["day"]),
-                        "signal_count": r["signal_count"],
-                        "source_count": r["source_count"],
-                        "narrative_count": narrative_map.get(str(r["day"]), 0),
-                    }
-                    for r in rows
-                ],
-            }
-        finally:
-            conn.close()
+        return await asyncio.to_thread(_query_history, days)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -729,15 +736,19 @@ router.include_router(agent_router)
 # ── Telegram Bot Endpoints ──
 
 @router.post("/telegram/webhook")
-async def telegram_webhook(request: Request):
-    """Receive Telegram bot webhook updates."""
+async def telegram_webhook(request: Request, background_tasks: BackgroundTasks):
+    """Receive Telegram bot webhook updates.
+
+    The update is handled after the response is sent so Telegram gets its ACK
+    without waiting on our DB and sendMessage round-trips.
+    """
     try:
         update = await request.json()
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid JSON")
 
     from telegram_bot import handle_webhook_update
-    await handle_webhook_update(update)
+    background_tasks.add_task(handle_webhook_update, update)
     return {"ok": True}
 
 
@@ -1,6 +1,6 @@
 """Collect social signals from X/Twitter and other sources"""
+import asyncio
 import logging
-import subprocess
 import json
 import math
 import httpx
@@ -9,6 +9,8 @@ import re
 from datetime import datetime
 from typing import List, Dict
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # KOLs to monitor
@@ -24,6 +26,12 @@ SOLANA_KOLS = [
     "solaboronnikov",  # Solana
 ]
 
+# Lowercased KOL handles for author matching
+_KOL_HANDLES_LOWER = frozenset(k.lower() for k in SOLANA_KOLS)
+
+# Twitter search requests allowed in flight at once
+_SEARCH_CONCURRENCY = 4
+
 SOLANA_KEYWORDS = [
     "solana", "sol", "defi", "nft", "anchor", "helius",
     "jupiter", "drift", "agent", "ai agent", "onchain",
@@ -38,8 +46,8 @@ async def collect_kol_tweets() -> List[Dict]:
     cache_path = os.path.join(os.path.dirname(__file__), "..", "data", "social_cache.json")
     if os.path.exists(cache_path):
         try:
-            with open(cache_path) as f:
-                cache = json.load(f)
+            with open(cache_path, "rb") as f:
+                cache = orjson.loads(f.read())
             cache_ts = datetime.fromisoformat(cache.get("collected_at", "2000-01-01"))
             age_hours = (datetime.utcnow() - cache_ts).total_seconds() / 3600
             if age_hours < 6:
@@ -128,8 +136,14 @@ async def _collect_via_xbird() -> List[Dict]:
                 "from:aeyakovenko",
                 "from:rajgokal",
             ]
-            for query in search_queries:
-                tweets = await search_tweets(query, 20)
+            sem = asyncio.Semaphore(_SEARCH_CONCURRENCY)
+
+            async def _search(query):
+                async with sem:
+                    return await search_tweets(query, 20)
+
+            results = await asyncio.gather(*(_search(q) for q in search_queries))
+            for query, tweets in zip(search_queries, results):
                 for tweet in tweets:
                     signals.append({
                         "source": "twitter",
@@ -502,8 +516,7 @@ def _compute_relevance_score(signal: Dict) -> float:
         score += min(math.log2(retweets) * 3, 15)
     
     # KOL author bonus
-    kol_lower = {k.lower() for k in SOLANA_KOLS}
-    if author in kol_lower:
+    if author in _KOL_HANDLES_LOWER:
         score += 25
     
     # Content quality: longer substantive content scores higher
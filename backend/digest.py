@@ -46,8 +46,8 @@ async def get_pool() -> asyncpg.Pool:
 
 async def subscribe(email: str, frequency: str = "weekly") -> dict:
     pool = await get_pool()
-    verify_token = str(uuid.uuid4())
-    unsubscribe_token = str(uuid.uuid4())
+    verify_token = uuid.uuid4()
+    unsubscribe_token = uuid.uuid4()
     try:
         await pool.execute(
             """INSERT INTO email_subscribers (email, verify_token, unsubscribe_token, frequency)
@@ -62,6 +62,10 @@ async def subscribe(email: str, frequency: str = "weekly") -> dict:
 
 
 async def unsubscribe(token: str) -> bool:
+    try:
+        token = uuid.UUID(token)
+    except ValueError:
+        return False
     pool = await get_pool()
     result = await pool.execute(
         "DELETE FROM email_subscribers WHERE unsubscribe_token = $1", token
@@ -1,15 +1,32 @@
 """PostgreSQL-backed analytics event store."""
 
 import os
+import json
 import asyncio
+import logging
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
 import asyncpg
 
+logger = logging.getLogger(__name__)
+
 DATABASE_URL = os.environ.get("DATABASE_URL", "")
 
+# Events are buffered in memory and written with COPY every
+# EVENT_FLUSH_INTERVAL seconds, or as soon as EVENT_BATCH_SIZE are queued
+EVENT_FLUSH_INTERVAL = 0.5
+EVENT_BATCH_SIZE = 1000
+
+_EVENT_COLUMNS = (
+    "app", "event", "properties", "session_id", "ip_hash",
+    "user_agent", "referrer", "path", "created_at",
+)
+
 _pool: Optional[asyncpg.Pool] = None
+_event_buffer: list = []
+_flush_task: Optional[asyncio.Task] = None
+_buffer_full: Optional[asyncio.Event] = None
 
 
 async def get_pool() -> asyncpg.Pool:
@@ -24,13 +41,42 @@ async def insert_event(
     session_id: str = None, ip_hash: str = None,
     user_agent: str = None, referrer: str = None, path: str = None,
 ):
-    pool = await get_pool()
-    await pool.execute(
-        """INSERT INTO analytics_events (app, event, properties, session_id, ip_hash, user_agent, referrer, path)
-           VALUES ($1, $2, $3::jsonb, $4, $5, $6, $7, $8)""",
-        app, event, __import__('json').dumps(properties),
+    """Queue an event; a background task writes queued events in batches."""
+    global _flush_task, _buffer_full
+    _event_buffer.append((
+        app, event, json.dumps(properties),
         session_id, ip_hash, user_agent, referrer, path,
-    )
+        datetime.now(timezone.utc),
+    ))
+    if _flush_task is None or _flush_task.done():
+        _buffer_full = asyncio.Event()
+        _flush_task = asyncio.create_task(_flush_loop())
+    if len(_event_buffer) >= EVENT_BATCH_SIZE:
+        _buffer_full.set()
+
+
+async def _flush_loop():
+    """Flush queued events until the buffer stays empty."""
+    while _event_buffer:
+        try:
+            await asyncio.wait_for(_buffer_full.wait(), EVENT_FLUSH_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        _buffer_full.clear()
+        await flush_events()
+
+
+async def flush_events():
+    """Write all queued events to analytics_events with a single COPY."""
+    global _event_buffer
+    if not _event_buffer:
+        return
+    batch, _event_buffer = _event_buffer, []
+    try:
+        pool = await get_pool()
+        await pool.copy_records_to_table("analytics_events", records=batch, columns=_EVENT_COLUMNS)
+    except Exception as e:
+        logger.error("Dropped %d analytics events: %s", len(batch), e)
 
 
 async def get_summary(app: str = None, days: int = 30) -> dict:
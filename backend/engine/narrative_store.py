@@ -3,13 +3,17 @@
 Uses PostgreSQL when DATABASE_URL is set, falls back to JSON file storage.
 """
 import hashlib
-import json
+import heapq
 import os
 import re
 import logging
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
+from itertools import chain
 from typing import Dict, List, Optional, Tuple
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 STORE_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "narratives_db.json")
@@ -21,6 +25,10 @@ _STOP_WORDS = frozenset({
     "solana", "sol", "protocol", "ecosystem", "network", "based", "powered",
 })
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+_CONF_RANK = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}
+
 # ── Maturity tiers ──
 
 MATURITY_TIERS = {
@@ -57,8 +65,9 @@ def _fade_threshold(maturity: str) -> int:
 
 # ── Helpers (unchanged) ──
 
+@lru_cache(maxsize=4096)
 def _canonical(name: str) -> str:
-    words = re.split(r"[^a-z0-9]+", name.lower())
+    words = _NON_ALNUM_RE.split(name.lower())
     return " ".join(w for w in words if w and w not in _STOP_WORDS)
 
 
@@ -66,22 +75,38 @@ def _stable_id(canonical_name: str) -> str:
     return hashlib.sha256(canonical_name.encode()).hexdigest()[:16]
 
 
-def _word_set(canonical: str) -> set:
-    return set(canonical.split())
+@lru_cache(maxsize=4096)
+def _word_set(canonical: str) -> frozenset:
+    """Token set of a canonical name; cached since find_match compares every stored name."""
+    return frozenset(canonical.split())
 
 
 def _word_overlap(a: str, b: str) -> float:
-    wa, wb = _word_set(a), _word_set(b)
+    return _set_overlap(_word_set(a), _word_set(b))
+
+
+def _set_overlap(wa: frozenset, wb: frozenset) -> float:
     if not wa or not wb:
         return 0.0
     overlap = len(wa & wb)
     return overlap / min(len(wa), len(wb))
 
 
+def _json_text(obj) -> str:
+    """Encode ``obj`` as a JSON string for TEXT/JSONB parameters."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso(ts: str) -> datetime:
+    """fromisoformat, cached: stored timestamps are re-read on every merge and API call."""
+    return datetime.fromisoformat(ts)
+
+
 # ── PostgreSQL helpers ──
 
 def _use_pg() -> bool:
@@ -162,9 +187,9 @@ def _migrate_json_if_needed(conn):
 
     logger.info("Migrating narratives from JSON to PostgreSQL...")
     try:
-        with open(STORE_PATH) as f:
-            store = json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
+        with open(STORE_PATH, "rb") as f:
+            store = orjson.loads(f.read())
+    except (orjson.JSONDecodeError, FileNotFoundError):
         return
 
     narratives = store.get("narratives", {})
@@ -226,13 +251,13 @@ def _upsert_narrative(cur, nid: str, entry: Dict):
         entry.get("explanation", ""),
         entry.get("trend_evidence", ""),
         entry.get("market_opportunity", ""),
-        json.dumps(entry.get("topics", [])),
-        json.dumps(entry.get("all_signals", [])),
-        json.dumps(entry.get("ideas", [])),
-        json.dumps(entry.get("existing_projects", [])),
-        json.dumps(entry.get("references", [])),
-        json.dumps(entry.get("confidence_history", [])),
-        json.dumps(entry.get("direction_history", [])),
+        _json_text(entry.get("topics", [])),
+        _json_text(entry.get("all_signals", [])),
+        _json_text(entry.get("ideas", [])),
+        _json_text(entry.get("existing_projects", [])),
+        _json_text(entry.get("references", [])),
+        _json_text(entry.get("confidence_history", [])),
+        _json_text(entry.get("direction_history", [])),
         entry.get("maturity", "EMERGING"),
     ))
 
@@ -243,7 +268,7 @@ def _row_to_entry(row, columns) -> Dict:
     for key in ("topics", "all_signals", "ideas", "existing_projects", "references_", "confidence_history", "direction_history"):
         val = d.get(key)
         if isinstance(val, str):
-            d[key] = json.loads(val)
+            d[key] = orjson.loads(val)
     # Map references_ -> references
     d["references"] = d.pop("references_", [])
     # Convert datetimes to ISO strings
@@ -288,17 +313,17 @@ def _load_meta_pg() -> Dict:
 
 def _load_store_json() -> Dict:
     try:
-        with open(STORE_PATH) as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        with open(STORE_PATH, "rb") as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
         return {"narratives": {}, "last_updated": None, "total_pipeline_runs": 0}
 
 
 def _save_store_json(store: Dict):
     os.makedirs(os.path.dirname(STORE_PATH), exist_ok=True)
     store["last_updated"] = _now_iso()
-    with open(STORE_PATH, "w") as f:
-        json.dump(store, f, indent=2)
+    with open(STORE_PATH, "wb") as f:
+        f.write(orjson.dumps(store, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
 
 # ── Public API ──
@@ -347,12 +372,53 @@ def save_store(store: Dict):
         _save_store_json(store)
 
 
-def find_match(canonical_name: str, store: Dict, threshold: float = 0.5) -> Optional[str]:
+class _NameIndex:
+    """Inverted index from canonical-name tokens to narrative ids.
+
+    Narratives sharing no token with a query score 0 and can never match, so
+    find_match only needs to look at the ids this returns.
+    """
+
+    def __init__(self, narratives: Dict):
+        self._ids: Dict[str, set] = {}
+        self._order: Dict[str, int] = {}
+        for nid, entry in narratives.items():
+            self.add(nid, entry.get("canonical_name", ""))
+
+    def add(self, nid: str, canonical: str):
+        self._order.setdefault(nid, len(self._order))
+        for word in _word_set(canonical):
+            self._ids.setdefault(word, set()).add(nid)
+
+    def discard(self, nid: str, canonical: str):
+        for word in _word_set(canonical):
+            ids = self._ids.get(word)
+            if ids:
+                ids.discard(nid)
+
+    def candidates(self, words: frozenset) -> List[str]:
+        """Ids sharing a token with ``words``, in store order so ties resolve as a full scan would."""
+        found = set()
+        for word in words:
+            found.update(self._ids.get(word, ()))
+        return sorted(found, key=self._order.__getitem__)
+
+
+def find_match(canonical_name: str, store: Dict, threshold: float = 0.5,
+               index: Optional[_NameIndex] = None) -> Optional[str]:
+    query = _word_set(canonical_name)
+    if not query:
+        return None
+    narratives = store.get("narratives", {})
+    candidates = narratives if index is None else index.candidates(query)
     best_id, best_score = None, threshold
-    for nid, entry in store.get("narratives", {}).items():
-        score = _word_overlap(canonical_name, entry.get("canonical_name", ""))
+    for nid in candidates:
+        score = _set_overlap(query, _word_set(narratives[nid].get("canonical_name", "")))
         if score > best_score:
             best_id, best_score = nid, score
+            # Overlap is capped at 1.0 and later ties never replace the best
+            if score >= 1.0:
+                break
     return best_id
 
 
@@ -367,17 +433,18 @@ def _dedup_signals(signals: List[Dict], cap: int = 30) -> List[Dict]:
                 seen_urls[url] = s
         else:
             no_url.append(s)
-    merged = list(seen_urls.values()) + no_url
-    merged.sort(key=lambda x: x.get("score", 0), reverse=True)
-    return merged[:cap]
+    # Only the top ``cap`` survive; nlargest keeps sorted()'s tie order
+    return heapq.nlargest(cap, chain(seen_urls.values(), no_url), key=lambda x: x.get("score", 0))
 
 
 def merge_narratives(new_narratives: List[Dict], store: Dict) -> Dict:
-    now = _now_iso()
+    now_dt = datetime.now(timezone.utc)
+    now = now_dt.isoformat()
     store.setdefault("narratives", {})
     store["total_pipeline_runs"] = store.get("total_pipeline_runs", 0) + 1
 
     matched_ids = set()
+    index = _NameIndex(store["narratives"])
     # Track changes for Telegram alerts
     _tg_new = []
     _tg_direction_changes = []
@@ -386,13 +453,16 @@ def merge_narratives(new_narratives: List[Dict], store: Dict) -> Dict:
     for n in new_narratives:
         name = n.get("name", "")
         canon = _canonical(name)
-        matched_id = find_match(canon, store)
+        matched_id = find_match(canon, store, index=index)
 
         if matched_id:
             entry = store["narratives"][matched_id]
             old_direction = entry.get("current_direction", "EMERGING")
             old_confidence = entry.get("current_confidence", "MEDIUM")
             entry["name"] = name
+            if entry.get("canonical_name") != canon:
+                index.discard(matched_id, entry.get("canonical_name", ""))
+                index.add(matched_id, canon)
             entry["canonical_name"] = canon
             entry["last_detected"] = now
             entry["last_updated"] = now
@@ -463,11 +533,18 @@ def merge_narratives(new_narratives: List[Dict], store: Dict) -> Dict:
                 "existing_projects": n.get("existing_projects", []),
                 "references": n.get("references", []),
             }
+            index.add(nid, canon)
             matched_ids.add(nid)
 
     _tg_faded = []
+    # One sweep ages unmatched ACTIVE narratives and upgrades legacy ARCHIVED ones.
+    # Never archive — FADED narratives stay FADED forever (historical data);
+    # old ARCHIVED ones get upgraded to HISTORICAL for queryability.
     for nid, entry in store["narratives"].items():
-        if nid not in matched_ids and entry.get("status") == "ACTIVE":
+        status = entry.get("status")
+        if status == "ARCHIVED":
+            entry["status"] = "HISTORICAL"
+        elif status == "ACTIVE" and nid not in matched_ids:
             entry["missed_count"] = entry.get("missed_count", 0) + 1
             # Recompute maturity (it doesn't change on miss, but ensure it's set)
             if "maturity" not in entry:
@@ -479,18 +556,12 @@ def merge_narratives(new_narratives: List[Dict], store: Dict) -> Dict:
                 # Calculate age
                 age_hours = 0
                 try:
-                    first = datetime.fromisoformat(entry.get("first_detected", now))
-                    age_hours = int((datetime.now(timezone.utc) - first).total_seconds() / 3600)
+                    first = _parse_iso(entry.get("first_detected", now))
+                    age_hours = int((now_dt - first).total_seconds() / 3600)
                 except Exception:
                     pass
                 _tg_faded.append({"name": entry.get("name", ""), "age_hours": age_hours})
 
-    # Never archive — FADED narratives stay FADED forever (historical data)
-    # Old ARCHIVED ones get upgraded to HISTORICAL for queryability
-    for entry in store["narratives"].values():
-        if entry.get("status") == "ARCHIVED":
-            entry["status"] = "HISTORICAL"
-
     # Record signal history and snapshots in PG
     if _use_pg():
         pipeline_run_count = store.get("total_pipeline_runs", 0)
@@ -501,12 +572,12 @@ def merge_narratives(new_narratives: List[Dict], store: Dict) -> Dict:
                 for n in new_narratives:
                     name = n.get("name", "")
                     canon = _canonical(name)
-                    nid = find_match(canon, store) or _stable_id(canon)
+                    nid = find_match(canon, store, index=index) or _stable_id(canon)
                     for signal in n.get("supporting_signals", []):
                         cur.execute("""
                             INSERT INTO narrative_signal_history (narrative_id, signal, pipeline_run, detected_at)
                             VALUES (%s, %s, %s, NOW())
-                        """, (nid, json.dumps(signal), pipeline_run_count))
+                        """, (nid, _json_text(signal), pipeline_run_count))
 
                 # Insert snapshots for all narratives
                 for nid, entry in store["narratives"].items():
@@ -554,9 +625,8 @@ def get_active_narratives(store: Dict) -> List[Dict]:
         finally:
             conn.close()
 
-    conf_order = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}
     active = [e for e in store.get("narratives", {}).values() if e.get("status") == "ACTIVE"]
-    active.sort(key=lambda e: (conf_order.get(e.get("current_confidence", "LOW"), 0), e.get("detection_count", 0)), reverse=True)
+    active.sort(key=lambda e: (_CONF_RANK.get(e.get("current_confidence", "LOW"), 0), e.get("detection_count", 0)), reverse=True)
     return active
 
 
@@ -579,7 +649,7 @@ def get_recently_faded(store: Dict, hours: int = 24) -> List[Dict]:
     for entry in store.get("narratives", {}).values():
         if entry.get("status") == "FADED" and entry.get("faded_at"):
             try:
-                faded_dt = datetime.fromisoformat(entry["faded_at"])
+                faded_dt = _parse_iso(entry["faded_at"])
                 if faded_dt > cutoff:
                     faded.append(entry)
             except (ValueError, TypeError):
@@ -598,7 +668,7 @@ def get_active_narrative_hints(store: Dict) -> List[str]:
         confidence = entry.get("current_confidence", "MEDIUM")
         maturity = entry.get("maturity") or _compute_maturity(entry)
         try:
-            last = datetime.fromisoformat(entry.get("last_detected", ""))
+            last = _parse_iso(entry.get("last_detected", ""))
             delta = now - last
             hours = int(delta.total_seconds() / 3600)
             if hours < 1:
@@ -620,16 +690,15 @@ def _compute_trending_status(entry: Dict) -> str:
     first = entry.get("first_detected", "")
     if first:
         try:
-            first_dt = datetime.fromisoformat(first)
+            first_dt = _parse_iso(first)
             if datetime.now(timezone.utc) - first_dt < timedelta(hours=24):
                 return "NEW"
         except (ValueError, TypeError):
             pass
     hist = entry.get("confidence_history", [])
-    conf_order = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}
     if len(hist) >= 2:
-        recent = conf_order.get(hist[-1].get("confidence", ""), 1)
-        prev = conf_order.get(hist[-2].get("confidence", ""), 1)
+        recent = _CONF_RANK.get(hist[-1].get("confidence", ""), 1)
+        prev = _CONF_RANK.get(hist[-2].get("confidence", ""), 1)
         if recent > prev:
             return "RISING"
         if recent < prev:
@@ -730,7 +799,7 @@ def get_narrative_signals_history(narrative_id: str, limit: int = 100) -> List[D
             """, (narrative_id, limit))
             results = []
             for row in cur.fetchall():
-                signal = row[0] if isinstance(row[0], dict) else json.loads(row[0]) if isinstance(row[0], str) else row[0]
+                signal = row[0] if isinstance(row[0], dict) else orjson.loads(row[0]) if isinstance(row[0], str) else row[0]
                 results.append({
                     "signal": signal,
                     "pipeline_run": row[1],
@@ -1,14 +1,19 @@
 """Main pipeline: collect → score → cluster → generate ideas → persist"""
-import json
+import asyncio
 import logging
 import os
+import shutil
 import time
 import uuid
 from datetime import datetime
 from typing import Dict
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+_JSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 from collectors.github_collector import collect_new_solana_repos, collect_trending_solana_repos
 from collectors.defillama_collector import collect_solana_tvl
 from collectors.social_collector import collect_kol_tweets
@@ -26,7 +31,7 @@ from collectors.devtools_collector import collect as collect_devtools
 from collectors.dune_collector import collect as collect_dune
 from engine.scorer import score_signals
 from engine.narrative_engine import cluster_narratives, generate_ideas
-from engine.store import save_run, get_signal_velocity, get_stats
+from engine.store import save_run_async, get_signal_velocity_async, get_stats_async
 from engine.narrative_tracker import update_narrative_states
 from engine.narrative_store import (
     load_store, save_store, merge_narratives,
@@ -35,6 +40,12 @@ from engine.narrative_store import (
 )
 
 
+def _write_json(path: str, payload) -> None:
+    """Serialize ``payload`` with orjson and write it to ``path``."""
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(payload, default=str, option=_JSON_OPTS))
+
+
 async def run_pipeline() -> Dict:
     """Run the full narrative detection pipeline"""
     logger.info("Starting narrative radar pipeline")
@@ -91,18 +102,18 @@ async def run_pipeline() -> Dict:
     
     # Phase 2: Score signals
     logger.info("Scoring signals")
-    scored = score_signals(all_signals)
+    # CPU-bound; keep it off the event loop so API requests stay responsive
+    scored = await asyncio.to_thread(score_signals, all_signals)
     
     # Save raw signals
     data_dir = os.path.join(os.path.dirname(__file__), "..", "data")
     os.makedirs(data_dir, exist_ok=True)
     
-    with open(os.path.join(data_dir, "signals.json"), "w") as f:
-        json.dump({
-            "signals": scored[:100],  # Keep top 100
-            "total_collected": len(all_signals),
-            "generated_at": datetime.utcnow().isoformat()
-        }, f, indent=2)
+    _write_json(os.path.join(data_dir, "signals.json"), {
+        "signals": scored[:100],  # Keep top 100
+        "total_collected": len(all_signals),
+        "generated_at": datetime.utcnow().isoformat()
+    })
     
     # Phase 3: Cluster into narratives
     logger.info("Detecting narratives")
@@ -168,26 +179,29 @@ async def run_pipeline() -> Dict:
     # Enrich narratives with velocity data from history
     for n in store_narratives:
         name_lower = n.get("name", "").lower()
-        velocity = get_signal_velocity(name_lower)
+        velocity = await get_signal_velocity_async(name_lower)
         if velocity.get("data_points", 0) >= 2:
             n["velocity"] = velocity
     
     report["narratives"] = store_narratives
     
     # Save report
-    with open(os.path.join(data_dir, "latest_report.json"), "w") as f:
-        json.dump(report, f, indent=2)
+    # Encode once, swap latest_report.json in atomically so readers never see
+    # a partial file, then copy the same bytes for the historical snapshot
+    latest_path = os.path.join(data_dir, "latest_report.json")
+    tmp_path = latest_path + ".tmp"
+    _write_json(tmp_path, report)
+    os.replace(tmp_path, latest_path)
     
     # Also save historical
     hist_file = os.path.join(data_dir, f"report_{datetime.utcnow().strftime('%Y-%m-%d')}.json")
-    with open(hist_file, "w") as f:
-        json.dump(report, f, indent=2)
+    shutil.copyfile(latest_path, hist_file)
     
     # Persist to SQLite
     run_id = str(uuid.uuid4())
     try:
-        save_run(run_id, scored, store_narratives, report.get("signal_summary", {}))
-        db_stats = get_stats()
+        await save_run_async(run_id, scored, store_narratives, report.get("signal_summary", {}))
+        db_stats = await get_stats_async()
         logger.info("Persisted to DB (total: %d signals, %d runs)", db_stats['total_signals_collected'], db_stats['total_runs'])
     except Exception as e:
         logger.error("DB persist error: %s", e)
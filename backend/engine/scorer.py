@@ -1,10 +1,14 @@
 """Score raw signals based on velocity, convergence, novelty, authority, and quality"""
-from typing import List, Dict, Set
+from typing import Callable, List, Dict, Set
 from datetime import datetime, timedelta, timezone
+from bisect import bisect_left, bisect_right
 from collections import Counter, defaultdict
+from functools import lru_cache
+
+import ahocorasick
 
 # Known Solana KOL handles for authority boosting
-SOLANA_KOLS = {
+SOLANA_KOLS = frozenset({
     "aaboronkov", "aaboronkov_", "0xmert_", "rajgokal", "armaniferrante",
     "buffalu__", "solaboratory", "heaboratory", "taboratory", "anatoly_yakovenko",
     "jaraboratory", "solana_devs", "superteam", "jaboratory", "solana",
@@ -12,63 +16,131 @@ SOLANA_KOLS = {
     "helaboratory", "marginfi", "tensorhq", "kamino_finance", "raaboratory",
     "solendprotocol", "phantom", "backaboratory", "madlads", "bonk_inu",
     "waboratory", "solblaze_org",
+})
+
+TOPIC_KEYWORDS: Dict[str, List[str]] = {
+    "ai_agents": ["ai agent", "agent", "autonomous", "llm", "chatbot", "eliza"],
+    "defi": ["defi", "lending", "borrowing", "yield", "amm", "dex", "swap", "liquidity"],
+    "payments": ["payment", "pay", "transfer", "remittance", "stablecoin"],
+    "nft": ["nft", "collectible", "metaplex", "digital art"],
+    "gaming": ["game", "gaming", "play-to-earn", "gamefi"],
+    "depin": ["depin", "physical", "iot", "sensor", "infrastructure"],
+    "social": ["social", "community", "messaging", "chat"],
+    "privacy": ["privacy", "zero-knowledge", "zk", "confidential"],
+    "rwa": ["rwa", "real world", "tokenized", "real-world asset"],
+    "trading": ["trading", "perp", "perpetual", "futures", "options", "copy-trad"],
+    "staking": ["staking", "stake", "liquid staking", "validator"],
+    "bridge": ["bridge", "cross-chain", "interop", "wormhole"],
+    "identity": ["identity", "did", "credential", "reputation"],
+    "memecoins": ["meme", "memecoin", "pump.fun", "fair launch"],
+    "infrastructure": ["infra", "rpc", "indexer", "sdk", "framework", "tooling"],
 }
 
 
+def _build_topic_automaton() -> "ahocorasick.Automaton":
+    """Compile every topic keyword into one Aho-Corasick automaton.
+
+    A keyword shared by several topics keeps the first topic, which never
+    happens with the current table but keeps the mapping deterministic.
+    """
+    automaton = ahocorasick.Automaton()
+    for topic, keywords in TOPIC_KEYWORDS.items():
+        for kw in keywords:
+            if kw not in automaton:
+                automaton.add_word(kw, topic)
+    automaton.make_automaton()
+    return automaton
+
+
+# One linear pass over the signal text finds every keyword (overlaps included)
+_TOPIC_AUTOMATON = _build_topic_automaton()
+
+# Threshold ladders as (ascending cut-offs, score per tier). A value strictly
+# greater than the k-th cut-off lands in tier k+1, see ``_tier``.
+VELOCITY_TVL_CHANGE = ((10, 20, 50), (0, 15, 25, 40))
+VELOCITY_ENGAGEMENT = ((10, 50, 100), (0, 10, 20, 30))
+VELOCITY_GH_STARS = ((10, 50, 100), (0, 5, 12, 20))
+AUTHORITY_GH_STARS = ((20, 100, 500), (50, 60, 70, 90))
+# Tier 0 (engagement_score <= 10) falls back on signal_type, see calculate_authority
+AUTHORITY_TWITTER_ENGAGEMENT = ((10, 50, 200, 500), (None, 55, 70, 85, 95))
+AUTHORITY_REDDIT_ENGAGEMENT = ((30, 100), (50, 60, 75))
+AUTHORITY_TVL = ((10_000_000, 100_000_000), (50, 70, 90))
+# Age ladders use "younger than N days", i.e. bisect_right on the cut-offs
+NOVELTY_AGE_DAYS = ((7, 14, 30), (90, 70, 50, 30))
+AUTHORITY_PUSH_AGE_DAYS = ((7, 30), (15, 5, 0))
+
+
+def _tier(value: float, ladder: tuple) -> float:
+    """Score for ``value`` on a strict ``>`` threshold ladder."""
+    cutoffs, scores = ladder
+    return scores[bisect_left(cutoffs, value)]
+
+
+def _age_tier(days: int, ladder: tuple) -> float:
+    """Score for an age in days on a strict ``<`` threshold ladder."""
+    cutoffs, scores = ladder
+    return scores[bisect_right(cutoffs, days)]
+
+
+# Signal fields scanned for topic keywords (plus any pre-tagged ``topics``)
+_TOPIC_TEXT_FIELDS = ("name", "description", "content", "category")
+
+
 def score_signals(signals: List[Dict]) -> List[Dict]:
-    """Score each signal and return sorted by score"""
+    """Score each signal and return sorted by score.
 
-    # --- Build cross-source topic map ---
-    # {topic: {source_type: count}}
-    topic_sources: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
-    # {topic: set of entity names seen}
-    topic_entities: Dict[str, Set[str]] = defaultdict(set)
-    # Track per-signal topics
-    signal_topics_map: Dict[int, List[str]] = {}
+    Each returned signal carries its extracted ``topics`` list; downstream
+    stages (clustering, storage) read it from there rather than re-extracting.
+    """
 
-    for i, s in enumerate(signals):
+    # --- Aggregate cross-source topic, temporal and entity data in one pass ---
+    # {topic: set of source types} -- only the distinct count is ever used
+    topic_sources: Dict[str, Set[str]] = defaultdict(set)
+    # {entity: set of source types}
+    entity_sources: Dict[str, Set[str]] = defaultdict(set)
+    # Temporal data for acceleration
+    signals_by_date: Counter = Counter()
+    topic_by_date: Dict[str, Counter] = defaultdict(Counter)
+    now = datetime.now(timezone.utc)
+    today_str = now.strftime("%Y-%m-%d")
+    # Per-signal topics and normalized entity names, aligned with ``signals``
+    # so they are derived once and reused by the scoring pass
+    topics_list: List[List[str]] = []
+    entities: List[str] = []
+
+    for s in signals:
         topics = extract_topics(s)
-        signal_topics_map[i] = topics
+        topics_list.append(topics)
         source = _normalize_source(s.get("source", "unknown"))
         entity = (s.get("name") or "").strip().lower()
-        for t in topics:
-            topic_sources[t][source] += 1
-            if entity:
-                topic_entities[t].add(entity)
-
-    # --- Build temporal data for acceleration ---
-    signals_by_date: Dict[str, int] = defaultdict(int)
-    topic_by_date: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
-    today_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-
-    for i, s in enumerate(signals):
+        entities.append(entity)
         collected = s.get("collected_at") or s.get("created_at") or ""
         date_str = _parse_date_str(collected) or today_str
+
         signals_by_date[date_str] += 1
-        for t in signal_topics_map[i]:
+        if entity:
+            entity_sources[entity].add(source)
+        for t in topics:
+            topic_sources[t].add(source)
             topic_by_date[t][date_str] += 1
 
     # Cross-source entity overlap: entities appearing in 2+ source types
-    cross_source_entities: Set[str] = set()
-    entity_sources: Dict[str, Set[str]] = defaultdict(set)
-    for i, s in enumerate(signals):
-        source = _normalize_source(s.get("source", "unknown"))
-        entity = (s.get("name") or "").strip().lower()
-        if entity:
-            entity_sources[entity].add(source)
-    for ent, srcs in entity_sources.items():
-        if len(srcs) >= 2:
-            cross_source_entities.add(ent)
+    cross_source_entities: Set[str] = {ent for ent, srcs in entity_sources.items() if len(srcs) >= 2}
 
-    scored = []
-    for i, s in enumerate(signals):
-        topics = signal_topics_map[i]
+    # Acceleration ratios are per-run, not per-signal: compute them once
+    acceleration = _global_acceleration(signals_by_date, today_str)
+    topic_boosts: Dict[str, int] = {
+        t: _topic_acceleration(dates, today_str) for t, dates in topic_by_date.items()
+    }
 
-        velocity = calculate_velocity(s, signals_by_date, topic_by_date, topics, today_str)
-        convergence_score = _calculate_convergence(s, topics, topic_sources, cross_source_entities)
-        novelty = calculate_novelty(s)
-        authority = calculate_authority(s)
-        quality = _calculate_quality(s, topics, topic_sources, cross_source_entities)
+    scored = []
+    for s, topics, entity in zip(signals, topics_list, entities):
+        is_cross_source = entity in cross_source_entities
+        velocity = calculate_velocity(s, topics=topics, acceleration=acceleration, topic_boosts=topic_boosts)
+        convergence_score = _calculate_convergence(topics, topic_sources, is_cross_source)
+        novelty = calculate_novelty(s, now)
+        authority = calculate_authority(s, now)
+        quality = _calculate_quality(s, is_cross_source)
 
         total_score = (
             velocity * 0.20 +
@@ -120,11 +192,25 @@ def _parse_date_str(dt_str: str) -> str | None:
         return None
 
 
+def _days_since(dt_str: str, now: datetime | None = None) -> int | None:
+    """Whole days between an ISO datetime string and ``now`` (UTC).
+
+    Naive timestamps are treated as UTC, matching how collectors stamp them.
+    Returns None when the string can't be parsed.
+    """
+    try:
+        dt = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+    except (ValueError, TypeError, AttributeError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return ((now or datetime.now(timezone.utc)) - dt).days
+
+
 def _calculate_convergence(
-    signal: Dict,
     topics: List[str],
-    topic_sources: Dict[str, Dict[str, int]],
-    cross_source_entities: Set[str],
+    topic_sources: Dict[str, Set[str]],
+    is_cross_source: bool,
 ) -> float:
     """Cross-source convergence scoring."""
     if not topics:
@@ -133,7 +219,7 @@ def _calculate_convergence(
     # Best topic by distinct source count
     best_distinct = 0
     for t in topics:
-        distinct = len(topic_sources.get(t, {}))
+        distinct = len(topic_sources.get(t, ()))
         best_distinct = max(best_distinct, distinct)
 
     # Map distinct source count to score
@@ -147,19 +233,13 @@ def _calculate_convergence(
         score = 20
 
     # Bonus for cross-source entity match
-    entity = (signal.get("name") or "").strip().lower()
-    if entity and entity in cross_source_entities:
+    if is_cross_source:
         score = min(score + 20, 100)
 
     return float(score)
 
 
-def _calculate_quality(
-    signal: Dict,
-    topics: List[str],
-    topic_sources: Dict[str, Dict[str, int]],
-    cross_source_entities: Set[str],
-) -> float:
+def _calculate_quality(signal: Dict, is_cross_source: bool) -> float:
     """Signal quality score (0-100)."""
     raw = 0
 
@@ -184,8 +264,7 @@ def _calculate_quality(
         raw += 10
 
     # Cross-source signal
-    entity = (signal.get("name") or "").strip().lower()
-    if entity and entity in cross_source_entities:
+    if is_cross_source:
         raw += 20
 
     # Normalize 0-65 -> 0-100
@@ -194,38 +273,147 @@ def _calculate_quality(
 
 def extract_topics(signal: Dict) -> List[str]:
     """Extract topic keywords from a signal"""
-    text = " ".join([
-        signal.get("name", "") or "",
-        signal.get("description", "") or "",
-        signal.get("content", "") or "",
-        signal.get("category", "") or "",
-        " ".join(signal.get("topics", []) or []),
-    ]).lower()
-
-    topic_keywords = {
-        "ai_agents": ["ai agent", "agent", "autonomous", "llm", "chatbot", "eliza"],
-        "defi": ["defi", "lending", "borrowing", "yield", "amm", "dex", "swap", "liquidity"],
-        "payments": ["payment", "pay", "transfer", "remittance", "stablecoin"],
-        "nft": ["nft", "collectible", "metaplex", "digital art"],
-        "gaming": ["game", "gaming", "play-to-earn", "gamefi"],
-        "depin": ["depin", "physical", "iot", "sensor", "infrastructure"],
-        "social": ["social", "community", "messaging", "chat"],
-        "privacy": ["privacy", "zero-knowledge", "zk", "confidential"],
-        "rwa": ["rwa", "real world", "tokenized", "real-world asset"],
-        "trading": ["trading", "perp", "perpetual", "futures", "options", "copy-trad"],
-        "staking": ["staking", "stake", "liquid staking", "validator"],
-        "bridge": ["bridge", "cross-chain", "interop", "wormhole"],
-        "identity": ["identity", "did", "credential", "reputation"],
-        "memecoins": ["meme", "memecoin", "pump.fun", "fair launch"],
-        "infrastructure": ["infra", "rpc", "indexer", "sdk", "framework", "tooling"],
-    }
+    parts = [signal.get(field) for field in _TOPIC_TEXT_FIELDS]
+    parts = [p for p in parts if p]
+    parts.extend(signal.get("topics") or ())
+    if not parts:
+        return ["other"]
+    # Fresh list per call so callers mutating it can't poison the cache
+    return list(_topics_for_text(" ".join(parts)))
+
+
+@lru_cache(maxsize=2048)
+def _topics_for_text(text: str) -> tuple:
+    """Topics matched in ``text``; cached since the same content arrives via several sources."""
+    matched = {topic for _, topic in _TOPIC_AUTOMATON.iter(text.lower())}
+    if not matched:
+        return ("other",)
+    return tuple(topic for topic in TOPIC_KEYWORDS if topic in matched)
+
+
+def _global_acceleration(signals_by_date: Dict[str, int], today_str: str) -> int:
+    """Velocity adjustment from today's signal count vs. the daily average."""
+    if not signals_by_date:
+        return 0
+    today_count = signals_by_date.get(today_str, 0)
+    avg = sum(signals_by_date.values()) / len(signals_by_date)
+    if avg <= 0:
+        return 0
+    ratio = today_count / avg
+    if ratio > 2.0:
+        return 25  # strong acceleration
+    if ratio > 1.5:
+        return 15  # moderate
+    if ratio < 0.8:
+        return -10  # declining
+    return 0
+
+
+def _topic_acceleration(dates: Dict[str, int], today_str: str) -> int:
+    """Velocity boost from a single topic's today count vs. its daily average."""
+    if not dates:
+        return 0
+    avg = sum(dates.values()) / len(dates)
+    if avg <= 0:
+        return 0
+    ratio = dates.get(today_str, 0) / avg
+    if ratio > 2.0:
+        return 15
+    if ratio > 1.5:
+        return 8
+    return 0
+
+
+# ── Per-source scoring ──
+# Each signal source maps to one handler, so scoring does a single dict lookup
+# instead of testing the source against every branch.
+
+def _velocity_defillama(signal: Dict) -> float:
+    return _tier(abs(signal.get("change_7d", 0)), VELOCITY_TVL_CHANGE)
+
+
+def _velocity_onchain(signal: Dict) -> float:
+    signal_type = signal.get("signal_type")
+    if signal_type == "token_trending":
+        return 25
+    if signal_type == "network_activity":
+        return 10
+    return 0
+
+
+def _velocity_social(signal: Dict) -> float:
+    bonus = _tier(signal.get("engagement", 0), VELOCITY_ENGAGEMENT)
+    if signal.get("signal_type") == "kol_tweet":
+        bonus += 10
+    return bonus
+
+
+def _velocity_github(signal: Dict) -> float:
+    return _tier(signal.get("stars", 0), VELOCITY_GH_STARS)
+
+
+_VELOCITY_BY_SOURCE: Dict[str, Callable[[Dict], float]] = {
+    "defillama": _velocity_defillama,
+    "solana_rpc": _velocity_onchain,
+    "birdeye": _velocity_onchain,
+    "solscan": _velocity_onchain,
+    "twitter": _velocity_social,
+    "twitter_nitter": _velocity_social,
+    "twitter_syndication": _velocity_social,
+    "reddit": _velocity_social,
+    "defillama_yields": lambda signal: 15,
+    "github": _velocity_github,
+}
+
+
+def _authority_github(signal: Dict, now: datetime | None) -> float:
+    score = _tier(signal.get("stars", 0), AUTHORITY_GH_STARS)
+
+    # Recent push activity boost
+    pushed_at = signal.get("pushed_at", "")
+    if pushed_at:
+        days_since = _days_since(pushed_at, now)
+        if days_since is not None:
+            score = min(score + _age_tier(days_since, AUTHORITY_PUSH_AGE_DAYS), 100)
+    return score
 
-    matched = []
-    for topic, keywords in topic_keywords.items():
-        if any(kw in text for kw in keywords):
-            matched.append(topic)
 
-    return matched if matched else ["other"]
+def _authority_twitter(signal: Dict, now: datetime | None) -> float:
+    # Use engagement_score if available
+    score = _tier(signal.get("engagement_score", 0), AUTHORITY_TWITTER_ENGAGEMENT)
+    if score is None:
+        score = 80 if signal.get("signal_type") == "kol_tweet" else 55
+
+    # KOL handle boost
+    handle = (signal.get("author") or signal.get("handle") or "").lower().strip("@")
+    if handle in SOLANA_KOLS:
+        score = min(score + 15, 100)
+    return score
+
+
+def _authority_reddit(signal: Dict, now: datetime | None) -> float:
+    score = _tier(signal.get("engagement", 0), AUTHORITY_REDDIT_ENGAGEMENT)
+    if signal.get("signal_type") == "dev_discussion":
+        score += 10
+    return score
+
+
+def _authority_defillama(signal: Dict, now: datetime | None) -> float:
+    return _tier(signal.get("tvl", 0), AUTHORITY_TVL)
+
+
+_AUTHORITY_BY_SOURCE: Dict[str, Callable[[Dict, datetime | None], float]] = {
+    "github": _authority_github,
+    "twitter": _authority_twitter,
+    "twitter_nitter": _authority_twitter,
+    "twitter_syndication": _authority_twitter,
+    "reddit": _authority_reddit,
+    "defillama": _authority_defillama,
+    "defillama_yields": lambda signal, now: 70,
+    "solana_rpc": lambda signal, now: 85,
+    "solscan": lambda signal, now: 85,
+    "birdeye": lambda signal, now: 70,
+}
 
 
 def calculate_velocity(
@@ -234,103 +422,47 @@ def calculate_velocity(
     topic_by_date: Dict[str, Dict[str, int]] | None = None,
     topics: List[str] | None = None,
     today_str: str | None = None,
+    acceleration: int | None = None,
+    topic_boosts: Dict[str, int] | None = None,
 ) -> float:
-    """Calculate velocity score using temporal acceleration when data available."""
+    """Calculate velocity score using temporal acceleration when data available.
+
+    ``acceleration`` and ``topic_boosts`` let callers scoring a whole batch
+    pass the per-run ratios precomputed once instead of re-deriving them from
+    the date maps for every signal.
+    """
     score = 50  # baseline
 
     # --- Temporal acceleration (if data provided) ---
-    if signals_by_date and today_str:
-        today_count = signals_by_date.get(today_str, 0)
-        all_counts = list(signals_by_date.values())
-        avg = sum(all_counts) / len(all_counts) if all_counts else 1
-        if avg > 0:
-            ratio = today_count / avg
-            if ratio > 2.0:
-                score += 25  # strong acceleration
-            elif ratio > 1.5:
-                score += 15  # moderate
-            elif ratio < 0.8:
-                score -= 10  # declining
+    if acceleration is not None:
+        score += acceleration
+    elif signals_by_date and today_str:
+        score += _global_acceleration(signals_by_date, today_str)
 
     # Topic-specific acceleration
-    if topic_by_date and topics and today_str:
-        best_topic_boost = 0
-        for t in topics:
-            dates = topic_by_date.get(t, {})
-            t_today = dates.get(today_str, 0)
-            t_counts = list(dates.values())
-            t_avg = sum(t_counts) / len(t_counts) if t_counts else 1
-            if t_avg > 0:
-                t_ratio = t_today / t_avg
-                if t_ratio > 2.0:
-                    best_topic_boost = max(best_topic_boost, 15)
-                elif t_ratio > 1.5:
-                    best_topic_boost = max(best_topic_boost, 8)
-        score += best_topic_boost
+    if topics:
+        if topic_boosts is not None:
+            score += max((topic_boosts.get(t, 0) for t in topics), default=0)
+        elif topic_by_date and today_str:
+            score += max(_topic_acceleration(topic_by_date.get(t, {}), today_str) for t in topics)
 
     # --- Source-specific signals (kept from original) ---
-    source = signal.get("source", "")
-
-    if source == "defillama":
-        change_7d = abs(signal.get("change_7d", 0))
-        if change_7d > 50:
-            score += 40
-        elif change_7d > 20:
-            score += 25
-        elif change_7d > 10:
-            score += 15
-
-    if source in ("solana_rpc", "birdeye", "solscan"):
-        if signal.get("signal_type") == "token_trending":
-            score += 25
-        elif signal.get("signal_type") == "network_activity":
-            score += 10
-
-    if source in ("twitter", "twitter_nitter", "twitter_syndication", "reddit"):
-        engagement = signal.get("engagement", 0)
-        if engagement > 100:
-            score += 30
-        elif engagement > 50:
-            score += 20
-        elif engagement > 10:
-            score += 10
-        if signal.get("signal_type") == "kol_tweet":
-            score += 10
-
-    if source == "defillama_yields":
-        score += 15
-
-    if source == "github":
-        stars = signal.get("stars", 0)
-        if stars > 100:
-            score += 20
-        elif stars > 50:
-            score += 12
-        elif stars > 10:
-            score += 5
+    source_bonus = _VELOCITY_BY_SOURCE.get(signal.get("source", ""))
+    if source_bonus is not None:
+        score += source_bonus(signal)
 
     return min(score, 100)
 
 
-def calculate_novelty(signal: Dict) -> float:
+def calculate_novelty(signal: Dict, now: datetime | None = None) -> float:
     """Calculate novelty based on creation recency"""
     score = 50
 
     created = signal.get("created_at", "")
     if created:
-        try:
-            created_dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
-            days_old = (datetime.now(created_dt.tzinfo) - created_dt).days
-            if days_old < 7:
-                score = 90
-            elif days_old < 14:
-                score = 70
-            elif days_old < 30:
-                score = 50
-            else:
-                score = 30
-        except Exception:
-            pass
+        days_old = _days_since(created, now)
+        if days_old is not None:
+            score = _age_tier(days_old, NOVELTY_AGE_DAYS)
 
     if signal.get("signal_type") == "new_repo":
         score += 15
@@ -338,78 +470,8 @@ def calculate_novelty(signal: Dict) -> float:
     return min(score, 100)
 
 
-def calculate_authority(signal: Dict) -> float:
+def calculate_authority(signal: Dict, now: datetime | None = None) -> float:
     """Calculate authority score based on source credibility and engagement data"""
-    score = 50
-
-    source = signal.get("source", "")
-
-    if source == "github":
-        stars = signal.get("stars", 0)
-        if stars > 500:
-            score = 90
-        elif stars > 100:
-            score = 70
-        elif stars > 20:
-            score = 60
-
-        # Recent push activity boost
-        pushed_at = signal.get("pushed_at", "")
-        if pushed_at:
-            try:
-                pushed_dt = datetime.fromisoformat(pushed_at.replace("Z", "+00:00"))
-                days_since = (datetime.now(pushed_dt.tzinfo) - pushed_dt).days
-                if days_since < 7:
-                    score = min(score + 15, 100)
-                elif days_since < 30:
-                    score = min(score + 5, 100)
-            except Exception:
-                pass
-
-    if source in ("twitter", "twitter_nitter", "twitter_syndication"):
-        # Use engagement_score if available
-        eng = signal.get("engagement_score", 0)
-        if eng > 500:
-            score = 95
-        elif eng > 200:
-            score = 85
-        elif eng > 50:
-            score = 70
-        elif eng > 10:
-            score = 55
-        elif signal.get("signal_type") == "kol_tweet":
-            score = 80
-        else:
-            score = 55
-
-        # KOL handle boost
-        handle = (signal.get("author") or signal.get("handle") or "").lower().strip("@")
-        if handle in SOLANA_KOLS:
-            score = min(score + 15, 100)
-
-    if source == "reddit":
-        engagement = signal.get("engagement", 0)
-        if engagement > 100:
-            score = 75
-        elif engagement > 30:
-            score = 60
-        if signal.get("signal_type") == "dev_discussion":
-            score += 10
-
-    if source == "defillama":
-        tvl = signal.get("tvl", 0)
-        if tvl > 100_000_000:
-            score = 90
-        elif tvl > 10_000_000:
-            score = 70
-
-    if source == "defillama_yields":
-        score = 70
-
-    if source in ("solana_rpc", "solscan"):
-        score = 85
-
-    if source == "birdeye":
-        score = 70
-
+    source_score = _AUTHORITY_BY_SOURCE.get(signal.get("source", ""))
+    score = 50 if source_score is None else source_score(signal, now)
     return min(score, 100)
@@ -2,17 +2,30 @@
 
 Uses PostgreSQL when DATABASE_URL is set, falls back to SQLite.
 """
-import json
+import asyncio
+import csv
+import io
 import os
 import logging
-from datetime import datetime, timedelta
+import threading
+import time
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "radar.db")
 DATABASE_URL = os.environ.get("DATABASE_URL", "")
 
+# Runs with more signals than this are loaded with COPY instead of INSERT
+COPY_THRESHOLD = 500
+# save_run skips waiting on the WAL flush unless STORE_SYNC_COMMIT is truthy;
+# a crash can only lose the last run, which the next pipeline run replaces
+STORE_SYNC_COMMIT = os.environ.get("STORE_SYNC_COMMIT", "").lower() in ("1", "true", "yes")
+
 
 def _use_pg() -> bool:
     return bool(DATABASE_URL)
@@ -21,17 +34,81 @@ def _use_pg() -> bool:
 # ── PostgreSQL backend ──
 
 _pg_initialized = False
+_pg_pool = None
+_pg_pool_lock = threading.Lock()
+_pg_init_lock = threading.Lock()
+PG_POOL_MAX_CONN = 10
+# ThreadedConnectionPool raises PoolError when exhausted instead of waiting,
+# so callers queue on this semaphore for a free slot first
+_pg_pool_slots = threading.BoundedSemaphore(PG_POOL_MAX_CONN)
 
 
 def _get_pg_conn():
+    """Borrow a connection from the shared pool; return it with _release_pg_conn.
+
+    Blocks while all pooled connections are checked out. A connection the
+    server dropped while it sat idle is discarded and replaced once.
+    """
+    global _pg_pool
+    if _pg_pool is None:
+        with _pg_pool_lock:
+            if _pg_pool is None:
+                from psycopg2.pool import ThreadedConnectionPool
+                # Sessions run in UTC so naive timestamps and date() buckets
+                # on TIMESTAMPTZ columns don't depend on the server's zone
+                _pg_pool = ThreadedConnectionPool(
+                    minconn=1, maxconn=PG_POOL_MAX_CONN, dsn=DATABASE_URL, options="-c timezone=UTC",
+                )
+    _pg_pool_slots.acquire()
+    try:
+        conn = _pg_pool.getconn()
+        if not _pg_conn_alive(conn):
+            _pg_pool.putconn(conn, close=True)
+            conn = _pg_pool.getconn()
+        return conn
+    except BaseException:
+        _pg_pool_slots.release()
+        raise
+
+
+def _pg_conn_alive(conn) -> bool:
+    """Ping a pooled connection; False if it was closed or the server went away."""
     import psycopg2
-    return psycopg2.connect(DATABASE_URL)
+    if conn.closed:
+        return False
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+    except (psycopg2.OperationalError, psycopg2.InterfaceError):
+        return False
+    return True
+
+
+def _release_pg_conn(conn):
+    """Hand a connection back to the pool (the pool rolls back any open transaction)."""
+    try:
+        _pg_pool.putconn(conn, close=bool(conn.closed))
+    finally:
+        _pg_pool_slots.release()
+
+
+def init_store():
+    """Create the Postgres schema up front; called once from app startup."""
+    if _use_pg():
+        _ensure_pg_tables()
 
 
 def _ensure_pg_tables():
-    global _pg_initialized
     if _pg_initialized:
         return
+    with _pg_init_lock:
+        if not _pg_initialized:
+            _create_pg_tables()
+
+
+def _create_pg_tables():
+    global _pg_initialized
     conn = _get_pg_conn()
     try:
         with conn.cursor() as cur:
@@ -44,7 +121,7 @@ def _ensure_pg_tables():
                     content TEXT,
                     topics JSONB DEFAULT '[]',
                     score REAL DEFAULT 0,
-                    collected_at TEXT NOT NULL,
+                    collected_at TIMESTAMPTZ NOT NULL,
                     run_id TEXT NOT NULL
                 );
                 CREATE TABLE IF NOT EXISTS signal_narratives (
@@ -65,16 +142,46 @@ def _ensure_pg_tables():
                     total_narratives INTEGER DEFAULT 0,
                     signal_summary JSONB
                 );
+                -- Tables created before collected_at became TIMESTAMPTZ stored ISO text,
+                -- often without an offset; read those as UTC whatever the session zone
+                DO $$
+                BEGIN
+                    IF (SELECT data_type FROM information_schema.columns
+                        WHERE table_name = 'signals' AND column_name = 'collected_at') = 'text' THEN
+                        SET LOCAL timezone = 'UTC';
+                        ALTER TABLE signals ALTER COLUMN collected_at TYPE TIMESTAMPTZ
+                            USING collected_at::timestamptz;
+                    END IF;
+                END $$;
                 CREATE INDEX IF NOT EXISTS idx_signals_source ON signals(source);
                 CREATE INDEX IF NOT EXISTS idx_signals_collected ON signals(collected_at);
                 CREATE INDEX IF NOT EXISTS idx_signals_run ON signals(run_id);
+                CREATE INDEX IF NOT EXISTS idx_signals_topics_gin ON signals USING GIN (topics jsonb_path_ops);
                 CREATE INDEX IF NOT EXISTS idx_snarr_run ON signal_narratives(run_id);
             """)
         conn.commit()
         _migrate_sqlite_if_needed(conn)
         _pg_initialized = True
     finally:
-        conn.close()
+        _release_pg_conn(conn)
+
+
+_MIGRATION_BATCH_SIZE = 1000
+# (SQLite SELECT, Postgres INSERT) pairs; columns are named so tuples line up
+_SQLITE_MIGRATIONS = (
+    (
+        "SELECT id, started_at, completed_at, total_signals, total_narratives, signal_summary FROM runs",
+        "INSERT INTO runs (id, started_at, completed_at, total_signals, total_narratives, signal_summary) VALUES %s ON CONFLICT DO NOTHING",
+    ),
+    (
+        "SELECT source, signal_type, name, content, topics, score, collected_at, run_id FROM signals",
+        "INSERT INTO signals (source, signal_type, name, content, topics, score, collected_at, run_id) VALUES %s",
+    ),
+    (
+        "SELECT name, confidence, direction, explanation, signal_count, generated_at, run_id FROM narratives",
+        "INSERT INTO signal_narratives (name, confidence, direction, explanation, signal_count, generated_at, run_id) VALUES %s",
+    ),
+)
 
 
 def _migrate_sqlite_if_needed(pg_conn):
@@ -88,28 +195,19 @@ def _migrate_sqlite_if_needed(pg_conn):
 
     logger.info("Migrating signal store from SQLite to PostgreSQL...")
     import sqlite3
+    from psycopg2.extras import execute_values
     sconn = sqlite3.connect(DB_PATH)
-    sconn.row_factory = sqlite3.Row
     try:
         with pg_conn.cursor() as cur:
-            # Migrate runs
-            for r in sconn.execute("SELECT * FROM runs").fetchall():
-                cur.execute(
-                    "INSERT INTO runs (id, started_at, completed_at, total_signals, total_narratives, signal_summary) VALUES (%s,%s,%s,%s,%s,%s) ON CONFLICT DO NOTHING",
-                    (r["id"], r["started_at"], r["completed_at"], r["total_signals"], r["total_narratives"], r["signal_summary"]),
-                )
-            # Migrate signals
-            for r in sconn.execute("SELECT * FROM signals").fetchall():
-                cur.execute(
-                    "INSERT INTO signals (source, signal_type, name, content, topics, score, collected_at, run_id) VALUES (%s,%s,%s,%s,%s,%s,%s,%s)",
-                    (r["source"], r["signal_type"], r["name"], r["content"], r["topics"], r["score"], r["collected_at"], r["run_id"]),
-                )
-            # Migrate narratives
-            for r in sconn.execute("SELECT * FROM narratives").fetchall():
-                cur.execute(
-                    "INSERT INTO signal_narratives (name, confidence, direction, explanation, signal_count, generated_at, run_id) VALUES (%s,%s,%s,%s,%s,%s,%s)",
-                    (r["name"], r["confidence"], r["direction"], r["explanation"], r["signal_count"], r["generated_at"], r["run_id"]),
-                )
+            # Stream each table through the SQLite cursor in fixed-size batches
+            # so memory stays flat regardless of history size
+            for select_sql, insert_sql in _SQLITE_MIGRATIONS:
+                rows = sconn.execute(select_sql)
+                while True:
+                    batch = rows.fetchmany(_MIGRATION_BATCH_SIZE)
+                    if not batch:
+                        break
+                    execute_values(cur, insert_sql, batch, page_size=_MIGRATION_BATCH_SIZE)
         pg_conn.commit()
         logger.info("SQLite signal store migrated to PostgreSQL")
         # Rename sqlite db
@@ -123,12 +221,26 @@ def _migrate_sqlite_if_needed(pg_conn):
 
 # ── SQLite backend (fallback) ──
 
+# Per-connection tuning: WAL with NORMAL sync (durable across app crashes,
+# one fsync per checkpoint), 256 MiB mmap, 64 MiB page cache, in-memory temps
+_SQLITE_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+    PRAGMA temp_store=MEMORY;
+"""
+_SQLITE_OPTIMIZE_INTERVAL = 15 * 60  # seconds between PRAGMA optimize runs
+_sqlite_last_optimize: Optional[float] = None
+
+
 def _get_sqlite_db():
     import sqlite3
+    global _sqlite_last_optimize
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_SQLITE_PRAGMAS)
     conn.executescript("""
         CREATE TABLE IF NOT EXISTS signals (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -164,11 +276,21 @@ def _get_sqlite_db():
         CREATE INDEX IF NOT EXISTS idx_signals_run ON signals(run_id);
         CREATE INDEX IF NOT EXISTS idx_narratives_run ON narratives(run_id);
     """)
+    # Refresh planner statistics now and then rather than on every open
+    now = time.monotonic()
+    if _sqlite_last_optimize is None or now - _sqlite_last_optimize >= _SQLITE_OPTIMIZE_INTERVAL:
+        _sqlite_last_optimize = now
+        conn.execute("PRAGMA optimize")
     return conn
 
 
 def get_db():
-    """Get database connection (PG or SQLite), creating tables if needed."""
+    """Get database connection (PG or SQLite).
+
+    ``init_store`` creates the Postgres schema at app startup; the
+    ``_ensure_pg_tables`` flag check here covers entry points that skip it,
+    such as run_pipeline.py.
+    """
     if _use_pg():
         _ensure_pg_tables()
         return _PgConnWrapper()
@@ -176,110 +298,159 @@ def get_db():
 
 
 class _PgConnWrapper:
-    """Wraps psycopg2 connection to provide sqlite3-like Row interface for routes.py compatibility."""
+    """Wraps psycopg2 connection to provide sqlite3-like Row interface for routes.py compatibility.
+
+    Cursors are RealDictCursors, so rows support ``r["column"]`` and ``dict(r)``
+    like sqlite3.Row (positional access is not supported).
+    """
 
     def __init__(self):
         self._conn = _get_pg_conn()
 
     def execute(self, sql, params=None):
+        from psycopg2.extras import RealDictCursor
         # Convert SQLite-style ? placeholders to %s
         sql = sql.replace("?", "%s")
-        cur = self._conn.cursor()
+        cur = self._conn.cursor(cursor_factory=RealDictCursor)
         cur.execute(sql, params or ())
-        return _PgCursorWrapper(cur)
+        return cur
 
     def commit(self):
         self._conn.commit()
 
     def close(self):
-        self._conn.close()
-
+        _release_pg_conn(self._conn)
 
-class _PgCursorWrapper:
-    """Wraps psycopg2 cursor to return DictRow objects from fetchall/fetchone."""
-    def __init__(self, cur):
-        self._cur = cur
 
-    def fetchall(self):
-        if not self._cur.description:
-            return []
-        columns = [d[0] for d in self._cur.description]
-        return [_DictRow(dict(zip(columns, r))) for r in self._cur.fetchall()]
+def _json_text(obj) -> str:
+    """Encode ``obj`` as a JSON string for TEXT/JSONB columns."""
+    return orjson.dumps(obj).decode()
 
-    def fetchone(self):
-        if not self._cur.description:
-            return None
-        columns = [d[0] for d in self._cur.description]
-        row = self._cur.fetchone()
-        return _DictRow(dict(zip(columns, row))) if row else None
 
+@lru_cache(maxsize=4096)
+def _encode_topics(topics: tuple) -> str:
+    """JSON-encode a topic list; runs share a handful of distinct lists."""
+    return _json_text(list(topics))
 
-class _DictRow:
-    """Mimics sqlite3.Row for dict-style access."""
-    def __init__(self, data):
-        self._data = data
 
-    def __getitem__(self, key):
-        if isinstance(key, int):
-            return list(self._data.values())[key]
-        return self._data[key]
+def _utc_iso(value):
+    """ISO timestamp with an explicit UTC offset; naive values are taken as UTC.
 
-    def keys(self):
-        return self._data.keys()
+    Collectors mix ``utcnow().isoformat()`` and aware timestamps, and a naive
+    string sent to a TIMESTAMPTZ column would be read in the session zone.
+    Values that don't parse are passed through unchanged.
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return value
+    if not isinstance(value, datetime):
+        return value
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _signal_rows(signals: List[Dict], run_id: str, now: str) -> List[tuple]:
+    """Build insert tuples for the signals table."""
+    return [
+        (s.get("source", "unknown"), s.get("signal_type", "unknown"), s.get("name", "")[:500],
+         s.get("content", "")[:2000], _encode_topics(tuple(s.get("topics", []))), s.get("score", 0),
+         _utc_iso(s.get("collected_at", now)), run_id)
+        for s in signals
+    ]
+
+
+def _narrative_rows(narratives: List[Dict], run_id: str, now: str) -> List[tuple]:
+    """Build insert tuples for the narratives table."""
+    return [
+        (n.get("name", ""), n.get("confidence", ""), n.get("direction", ""),
+         n.get("explanation", ""), len(n.get("supporting_signals", [])), now, run_id)
+        for n in narratives
+    ]
+
+
+_COPY_NULL = "\\N"
+_SIGNAL_COPY_COLUMNS = "source, signal_type, name, content, topics, score, collected_at, run_id"
+
+
+def _copy_signal_rows(cur, rows: List[tuple]):
+    """Stream signal rows into Postgres with COPY ... FROM STDIN (CSV)."""
+    buf = io.StringIO()
+    # QUOTE_NONNUMERIC quotes every non-number, None included (as ""), and COPY
+    # reads a quoted empty field as ''. Write None as an explicit marker and
+    # FORCE_NULL it so NULLs survive while real empty strings stay ''.
+    csv.writer(buf, quoting=csv.QUOTE_NONNUMERIC, lineterminator="\n").writerows(
+        [_COPY_NULL if v is None else v for v in row] for row in rows
+    )
+    buf.seek(0)
+    cur.copy_expert(
+        f"COPY signals ({_SIGNAL_COPY_COLUMNS}) FROM STDIN "
+        f"WITH (FORMAT csv, NULL '{_COPY_NULL}', FORCE_NULL ({_SIGNAL_COPY_COLUMNS}))",
+        buf,
+    )
 
 
 def save_run(run_id: str, signals: List[Dict], narratives: List[Dict], summary: Dict):
     """Save a complete pipeline run."""
+    global _stats_cache
     if _use_pg():
+        from psycopg2.extras import execute_values
         _ensure_pg_tables()
         conn = _get_pg_conn()
         try:
             now = datetime.utcnow().isoformat()
             with conn.cursor() as cur:
+                if not STORE_SYNC_COMMIT:
+                    cur.execute("SET LOCAL synchronous_commit = OFF")
                 cur.execute(
                     "INSERT INTO runs (id, started_at, completed_at, total_signals, total_narratives, signal_summary) VALUES (%s,%s,%s,%s,%s,%s) ON CONFLICT (id) DO UPDATE SET completed_at=EXCLUDED.completed_at, total_signals=EXCLUDED.total_signals, total_narratives=EXCLUDED.total_narratives, signal_summary=EXCLUDED.signal_summary",
-                    (run_id, now, now, len(signals), len(narratives), json.dumps(summary)),
+                    (run_id, now, now, len(signals), len(narratives), _json_text(summary)),
                 )
-                for s in signals:
-                    cur.execute(
-                        "INSERT INTO signals (source, signal_type, name, content, topics, score, collected_at, run_id) VALUES (%s,%s,%s,%s,%s,%s,%s,%s)",
-                        (s.get("source", "unknown"), s.get("signal_type", "unknown"), s.get("name", "")[:500],
-                         s.get("content", "")[:2000], json.dumps(s.get("topics", [])), s.get("score", 0),
-                         s.get("collected_at", now), run_id),
-                    )
-                for n in narratives:
-                    cur.execute(
-                        "INSERT INTO signal_narratives (name, confidence, direction, explanation, signal_count, generated_at, run_id) VALUES (%s,%s,%s,%s,%s,%s,%s)",
-                        (n.get("name", ""), n.get("confidence", ""), n.get("direction", ""),
-                         n.get("explanation", ""), len(n.get("supporting_signals", [])), now, run_id),
+                signal_rows = _signal_rows(signals, run_id, now)
+                if len(signal_rows) > COPY_THRESHOLD:
+                    _copy_signal_rows(cur, signal_rows)
+                else:
+                    # One multi-row INSERT per page instead of a round-trip per row
+                    execute_values(
+                        cur,
+                        "INSERT INTO signals (source, signal_type, name, content, topics, score, collected_at, run_id) VALUES %s",
+                        signal_rows,
+                        page_size=500,
                     )
+                execute_values(
+                    cur,
+                    "INSERT INTO signal_narratives (name, confidence, direction, explanation, signal_count, generated_at, run_id) VALUES %s",
+                    _narrative_rows(narratives, run_id, now),
+                    page_size=500,
+                )
             conn.commit()
+            _stats_cache = None
         finally:
-            conn.close()
+            _release_pg_conn(conn)
         return
 
     # SQLite fallback
     conn = _get_sqlite_db()
     try:
         now = datetime.utcnow().isoformat()
+        # One write transaction for the whole run; take the write lock up front
+        conn.execute("BEGIN IMMEDIATE")
         conn.execute(
             "INSERT OR REPLACE INTO runs (id, started_at, completed_at, total_signals, total_narratives, signal_summary) VALUES (?,?,?,?,?,?)",
-            (run_id, now, now, len(signals), len(narratives), json.dumps(summary)),
+            (run_id, now, now, len(signals), len(narratives), _json_text(summary)),
+        )
+        conn.executemany(
+            "INSERT INTO signals (source, signal_type, name, content, topics, score, collected_at, run_id) VALUES (?,?,?,?,?,?,?,?)",
+            _signal_rows(signals, run_id, now),
+        )
+        conn.executemany(
+            "INSERT INTO narratives (name, confidence, direction, explanation, signal_count, generated_at, run_id) VALUES (?,?,?,?,?,?,?)",
+            _narrative_rows(narratives, run_id, now),
         )
-        for s in signals:
-            conn.execute(
-                "INSERT INTO signals (source, signal_type, name, content, topics, score, collected_at, run_id) VALUES (?,?,?,?,?,?,?,?)",
-                (s.get("source", "unknown"), s.get("signal_type", "unknown"), s.get("name", "")[:500],
-                 s.get("content", "")[:2000], json.dumps(s.get("topics", [])), s.get("score", 0),
-                 s.get("collected_at", now), run_id),
-            )
-        for n in narratives:
-            conn.execute(
-                "INSERT INTO narratives (name, confidence, direction, explanation, signal_count, generated_at, run_id) VALUES (?,?,?,?,?,?,?)",
-                (n.get("name", ""), n.get("confidence", ""), n.get("direction", ""),
-                 n.get("explanation", ""), len(n.get("supporting_signals", [])), now, run_id),
-            )
         conn.commit()
+        _stats_cache = None
     finally:
         conn.close()
 
@@ -289,15 +460,17 @@ def get_signal_velocity(topic: str, days: int = 7) -> Dict:
         _ensure_pg_tables()
         conn = _get_pg_conn()
         try:
-            cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
+            cutoff = datetime.now(timezone.utc) - timedelta(days=days)
             with conn.cursor() as cur:
+                # JSONB containment can use the GIN index instead of a LIKE scan;
+                # collected_at is TIMESTAMPTZ, so bucket days explicitly in UTC
                 cur.execute("""
-                    SELECT collected_at::date as day, COUNT(*) as count
+                    SELECT (collected_at AT TIME ZONE 'UTC')::date as day, COUNT(*) as count
                     FROM signals
-                    WHERE topics::text LIKE %s AND collected_at > %s
-                    GROUP BY collected_at::date
+                    WHERE topics @> %s::jsonb AND collected_at > %s
+                    GROUP BY 1
                     ORDER BY day
-                """, (f'%"{topic}"%', cutoff))
+                """, (_json_text([topic]), cutoff))
                 rows = cur.fetchall()
             if len(rows) < 2:
                 return {"velocity": 0, "trend": "insufficient_data", "data_points": len(rows)}
@@ -309,7 +482,7 @@ def get_signal_velocity(topic: str, days: int = 7) -> Dict:
             return {"velocity": round(velocity, 1), "trend": trend, "data_points": len(rows),
                     "daily_counts": {str(r[0]): r[1] for r in rows}}
         finally:
-            conn.close()
+            _release_pg_conn(conn)
 
     # SQLite fallback
     conn = _get_sqlite_db()
@@ -336,17 +509,17 @@ def get_signal_velocity(topic: str, days: int = 7) -> Dict:
 def get_narrative_history(name: str, limit: int = 10) -> List[Dict]:
     if _use_pg():
         _ensure_pg_tables()
+        from psycopg2.extras import RealDictCursor
         conn = _get_pg_conn()
         try:
-            with conn.cursor() as cur:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
                 cur.execute("""
                     SELECT confidence, direction, signal_count, generated_at
                     FROM signal_narratives WHERE name = %s ORDER BY generated_at DESC LIMIT %s
                 """, (name, limit))
-                cols = [d[0] for d in cur.description]
-                return [dict(zip(cols, r)) for r in cur.fetchall()]
+                return [dict(r) for r in cur.fetchall()]
         finally:
-            conn.close()
+            _release_pg_conn(conn)
 
     conn = _get_sqlite_db()
     try:
@@ -359,45 +532,71 @@ def get_narrative_history(name: str, limit: int = 10) -> List[Dict]:
         conn.close()
 
 
+# Signal totals come from the per-run counters save_run writes, so stats
+# aggregate over the small runs table instead of scanning signals
+_STATS_SQL = """
+    SELECT COALESCE(SUM(total_signals), 0),
+           COUNT(*),
+           (SELECT COUNT(DISTINCT name) FROM {narratives}),
+           MIN(started_at),
+           MAX(completed_at)
+    FROM runs
+"""
+STATS_CACHE_TTL = 30  # seconds; counts only move when save_run writes
+_stats_cache: Optional[tuple] = None  # (expires_at, stats)
+
+
+def _stats_dict(row) -> Dict:
+    total_signals, total_runs, total_narratives, first_run, last_run = row
+    return {
+        "total_signals_collected": total_signals,
+        "total_runs": total_runs,
+        "unique_narratives": total_narratives,
+        "tracking_since": first_run,
+        "last_run": last_run,
+    }
+
+
 def get_stats() -> Dict:
+    global _stats_cache
+    if _stats_cache is not None and _stats_cache[0] > time.monotonic():
+        return dict(_stats_cache[1])
+
     if _use_pg():
         _ensure_pg_tables()
         conn = _get_pg_conn()
         try:
             with conn.cursor() as cur:
-                cur.execute("SELECT COUNT(*) FROM signals")
-                total_signals = cur.fetchone()[0]
-                cur.execute("SELECT COUNT(*) FROM runs")
-                total_runs = cur.fetchone()[0]
-                cur.execute("SELECT COUNT(DISTINCT name) FROM signal_narratives")
-                total_narratives = cur.fetchone()[0]
-                cur.execute("SELECT MIN(started_at) FROM runs")
-                first_run = cur.fetchone()[0]
-                cur.execute("SELECT MAX(completed_at) FROM runs")
-                last_run = cur.fetchone()[0]
-            return {
-                "total_signals_collected": total_signals,
-                "total_runs": total_runs,
-                "unique_narratives": total_narratives,
-                "tracking_since": first_run,
-                "last_run": last_run,
-            }
+                cur.execute(_STATS_SQL.format(narratives="signal_narratives"))
+                stats = _stats_dict(cur.fetchone())
+        finally:
+            _release_pg_conn(conn)
+    else:
+        conn = _get_sqlite_db()
+        try:
+            stats = _stats_dict(conn.execute(_STATS_SQL.format(narratives="narratives")).fetchone())
         finally:
             conn.close()
 
-    conn = _get_sqlite_db()
-    try:
-        total_signals = conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0]
-        total_runs = conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
-        total_narratives = conn.execute("SELECT COUNT(DISTINCT name) FROM narratives").fetchone()[0]
-        first_run = conn.execute("SELECT MIN(started_at) FROM runs").fetchone()[0]
-        last_run = conn.execute("SELECT MAX(completed_at) FROM runs").fetchone()[0]
-        return {
-            "total_signals_collected": total_signals,
-            "total_runs": total_runs,
-            "unique_narratives": total_narratives,
-            "tracking_since": first_run,
-            "last_run": last_run,
-        }
-    finally:
-        conn.close()
+    _stats_cache = (time.monotonic() + STATS_CACHE_TTL, stats)
+    return dict(stats)
+
+
+# ── Async wrappers ──
+# The store is synchronous (psycopg2 / sqlite3); these run it in a worker
+# thread so callers on the event loop don't stall on database I/O.
+
+async def save_run_async(run_id: str, signals: List[Dict], narratives: List[Dict], summary: Dict):
+    return await asyncio.to_thread(save_run, run_id, signals, narratives, summary)
+
+
+async def get_signal_velocity_async(topic: str, days: int = 7) -> Dict:
+    return await asyncio.to_thread(get_signal_velocity, topic, days)
+
+
+async def get_narrative_history_async(name: str, limit: int = 10) -> List[Dict]:
+    return await asyncio.to_thread(get_narrative_history, name, limit)
+
+
+async def get_stats_async() -> Dict:
+    return await asyncio.to_thread(get_stats)
@@ -1,12 +1,13 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import FileResponse, JSONResponse, Response
+from starlette.datastructures import MutableHeaders
 from api.routes import router
 from contextlib import asynccontextmanager
 import logging
 import os
+import time
 import hashlib
 import sentry_sdk
 
@@ -16,16 +17,73 @@ setup_logging()
 logger = logging.getLogger(__name__)
 
 
-class NoCacheHTMLMiddleware(BaseHTTPMiddleware):
-    """Prevent browser caching of HTML pages so deploys are immediately visible."""
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        content_type = response.headers.get("content-type", "")
-        if "text/html" in content_type:
-            response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
-        return response
+class NoCacheHTMLMiddleware:
+    """Prevent browser caching of HTML pages so deploys are immediately visible.
+
+    Plain ASGI middleware: only the response-start message is touched, so
+    there is no per-request task group as with BaseHTTPMiddleware.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                if "text/html" in headers.get("content-type", ""):
+                    headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
+                    headers["Pragma"] = "no-cache"
+                    headers["Expires"] = "0"
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+# Request paths not worth a log line
+_LOG_SKIP_PREFIXES = ("/static", "/img")
+
+
+class RequestLogMiddleware:
+    """Log method, path, status and duration for each non-static request."""
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if scope["type"] != "http" or path.startswith(_LOG_SKIP_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            logger.info("request | %s %s | %s | %.3fs", scope["method"], path, status_code, time.perf_counter() - start)
+
+
+# Paths never worth tracing; everything else is sampled at 10%
+_TRACE_SKIP_PREFIXES = ("/static", "/img", "/health")
+
+
+def _traces_sampler(ctx: dict) -> float:
+    path = (ctx.get("asgi_scope") or {}).get("path", "")
+    if path.startswith(_TRACE_SKIP_PREFIXES):
+        return 0.0
+    if ctx.get("parent_sampled") is not None:
+        return float(ctx["parent_sampled"])
+    return 0.1
 
 
 # Initialize Sentry if DSN is configured
@@ -33,14 +91,14 @@ _sentry_dsn = os.getenv("SENTRY_DSN", "")
 if _sentry_dsn:
     sentry_sdk.init(
         dsn=_sentry_dsn,
-        traces_sample_rate=0.1,
+        traces_sampler=_traces_sampler,
         environment=os.getenv("ENVIRONMENT", "production"),
     )
 import asyncio
-import json
-import time
 from datetime import datetime, timezone, timedelta
 
+import orjson
+
 # Agent loop interval (2 hours)
 AGENT_LOOP_INTERVAL = 2 * 60 * 60
 STALE_THRESHOLD = 4 * 60 * 60  # 4 hours
@@ -49,92 +107,136 @@ DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
 REPORT_PATH = os.path.join(DATA_DIR, "latest_report.json")
 STATUS_PATH = os.path.join(DATA_DIR, "pipeline_status.json")
 
-# Global lock to prevent concurrent pipeline runs
-_pipeline_lock = asyncio.Lock()
+# Set while a pipeline run is in flight; prevents concurrent runs
 _pipeline_running = False
 
+# engine.pipeline.run_pipeline, imported during startup
+_run_pipeline = None
+
+
+# Pipeline status kept in memory; loaded from disk once at startup and
+# written back only when it changes
+_status_cache: dict = {}
+
 
 def _load_status():
     try:
-        with open(STATUS_PATH) as f:
-            return json.load(f)
+        with open(STATUS_PATH, "rb") as f:
+            return orjson.loads(f.read())
     except Exception:
         return {}
 
 
 def _save_status(status: dict):
     os.makedirs(DATA_DIR, exist_ok=True)
-    with open(STATUS_PATH, "w") as f:
-        json.dump(status, f, indent=2)
+    with open(STATUS_PATH, "wb") as f:
+        f.write(orjson.dumps(status, option=orjson.OPT_INDENT_2))
+
+
+async def _flush_status():
+    """Write a snapshot of the status cache to disk in a worker thread."""
+    await asyncio.to_thread(_save_status, dict(_status_cache))
+
+
+# (mtime_ns, size) of the report last parsed for /health, and its generated_at
+_health_report_key = None
+_health_last_run = None
+
+
+def _report_last_run():
+    """generated_at of the latest report, re-parsed only when the file changes."""
+    global _health_report_key, _health_last_run
+    st = os.stat(REPORT_PATH)
+    key = (st.st_mtime_ns, st.st_size)
+    if key != _health_report_key:
+        with open(REPORT_PATH, "rb") as f:
+            _health_last_run = orjson.loads(f.read()).get("generated_at")
+        _health_report_key = key
+    return _health_last_run
 
 
 def _report_is_stale() -> bool:
     """Check if latest_report.json is missing or older than STALE_THRESHOLD."""
-    if not os.path.exists(REPORT_PATH):
-        return True
     try:
-        age = time.time() - os.path.getmtime(REPORT_PATH)
-        return age > STALE_THRESHOLD
-    except Exception:
+        mtime = os.stat(REPORT_PATH).st_mtime
+    except OSError:
         return True
+    return time.time() - mtime > STALE_THRESHOLD
 
 
 async def run_pipeline_task():
     """Run the pipeline with status tracking. Prevents concurrent runs."""
-    global _pipeline_running
-    if _pipeline_lock.locked():
+    global _pipeline_running, _health_report_key, _health_last_run, _run_pipeline
+    # Check-and-set with no await in between is atomic on the event loop
+    if _pipeline_running:
         logger.info("Pipeline already running, skipping")
         return
+    _pipeline_running = True
 
-    async with _pipeline_lock:
-        _pipeline_running = True
-        now = datetime.now(timezone.utc)
-        next_run = (now + timedelta(seconds=AGENT_LOOP_INTERVAL)).isoformat()
-        _save_status({
-            **_load_status(),
+    now = datetime.now(timezone.utc)
+    next_run = (now + timedelta(seconds=AGENT_LOOP_INTERVAL)).isoformat()
+    start = time.monotonic()
+    try:
+        _status_cache.update({
             "status": "running",
             "next_run": next_run,
             "started_at": now.isoformat(),
         })
+        await _flush_status()
+
+        if _run_pipeline is None:
+            from engine.pipeline import run_pipeline as _run_pipeline
+        logger.info("Running pipeline at %s", now.isoformat())
+        result = await _run_pipeline()
+        duration = round(time.monotonic() - start, 1)
+        n_count = len(result.get("narratives", []))
+        s_count = result.get("signal_summary", {}).get("total_collected", 0)
+        logger.info("Pipeline done in %.1fs: %d signals -> %d narratives", duration, s_count, n_count)
+
+        # Prime the /health cache with the report just written so it doesn't
+        # have to go back to disk
+        try:
+            st = os.stat(REPORT_PATH)
+            _health_report_key = (st.st_mtime_ns, st.st_size)
+            _health_last_run = result.get("generated_at")
+        except OSError:
+            pass
 
-        start = time.time()
+        _status_cache.clear()
+        _status_cache.update({
+            "last_run": datetime.now(timezone.utc).isoformat(),
+            "next_run": next_run,
+            "status": "idle",
+            "duration_seconds": duration,
+            "signal_count": s_count,
+            "narrative_count": n_count,
+        })
+        await _flush_status()
+    except Exception as e:
+        duration = round(time.monotonic() - start, 1)
+        logger.error("Pipeline error after %.1fs: %s", duration, e, exc_info=True)
+        _status_cache.update({
+            "status": "idle",
+            "last_error": str(e),
+            "duration_seconds": duration,
+        })
         try:
-            from engine.pipeline import run_pipeline
-            logger.info("Running pipeline at %s", now.isoformat())
-            result = await run_pipeline()
-            duration = round(time.time() - start, 1)
-            n_count = len(result.get("narratives", []))
-            s_count = result.get("signal_summary", {}).get("total_collected", 0)
-            logger.info("Pipeline done in %.1fs: %d signals -> %d narratives", duration, s_count, n_count)
-
-            _save_status({
-                "last_run": datetime.now(timezone.utc).isoformat(),
-                "next_run": next_run,
-                "status": "idle",
-                "duration_seconds": duration,
-                "signal_count": s_count,
-                "narrative_count": n_count,
-            })
-        except Exception as e:
-            duration = round(time.time() - start, 1)
-            logger.error("Pipeline error after %.1fs: %s", duration, e, exc_info=True)
-            _save_status({
-                **_load_status(),
-                "status": "idle",
-                "last_error": str(e),
-                "duration_seconds": duration,
-            })
-        finally:
-            _pipeline_running = False
+            await _flush_status()
+        except Exception as flush_err:
+            logger.error("Failed to write pipeline status: %s", flush_err)
+    finally:
+        _pipeline_running = False
+
+
+def _next_rollup_ts() -> float:
+    """Unix timestamp of 00:05 UTC tomorrow."""
+    return time.time() // 86400 * 86400 + 86400 + 5 * 60
 
 
 async def analytics_rollup_loop():
     """Run daily analytics rollup at ~midnight UTC."""
     while True:
-        now = datetime.now(timezone.utc)
-        # Sleep until next midnight + 5 min
-        tomorrow = (now + timedelta(days=1)).replace(hour=0, minute=5, second=0, microsecond=0)
-        await asyncio.sleep((tomorrow - now).total_seconds())
+        await asyncio.sleep(max(0.0, _next_rollup_ts() - time.time()))
         try:
             from engine.analytics_db import run_daily_rollup, cleanup_old_events
             await run_daily_rollup()
@@ -153,8 +255,24 @@ async def agent_loop():
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global _run_pipeline
     logger.info("Solana Narrative Radar Agent starting")
 
+    # Bootstrap the signal store schema once instead of on request paths
+    try:
+        from engine.store import init_store
+        await asyncio.to_thread(init_store)
+    except Exception as e:
+        logger.error("Signal store init failed: %s", e)
+
+    _status_cache.update(await asyncio.to_thread(_load_status))
+
+    # Import the pipeline now so the first run doesn't pay for it
+    try:
+        from engine.pipeline import run_pipeline as _run_pipeline
+    except Exception as e:
+        logger.error("Pipeline import failed: %s", e)
+
     # Check if we need an immediate run
     if _report_is_stale():
         logger.info("Report stale or missing, triggering background pipeline run")
@@ -172,14 +290,42 @@ async def lifespan(app: FastAPI):
 
     task.cancel()
     rollup_task.cancel()
+
+    # Write out any analytics events and usage rows still queued
+    try:
+        from engine.analytics_db import flush_events
+        from rate_limiter import flush_key_usage, flush_usage_log
+        await flush_events()
+        await flush_usage_log()
+        await flush_key_usage()
+    except Exception as e:
+        logger.error("Flush on shutdown failed: %s", e)
+
+    try:
+        from telegram_bot import close_client, close_pool
+        await close_client()
+        await close_pool()
+    except Exception as e:
+        logger.error("Telegram shutdown failed: %s", e)
     logger.info("Agent shutting down")
 
 
+class ORJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson; non-string dict keys are allowed as in stdlib json.
+
+    Defined here rather than using fastapi.responses.ORJSONResponse, which
+    newer FastAPI releases deprecate.
+    """
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 app = FastAPI(
     title="Solana Narrative Radar",
     description="AI-powered narrative detection for the Solana ecosystem",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -195,14 +341,7 @@ app.add_middleware(NoCacheHTMLMiddleware)
 from rate_limiter import RateLimitMiddleware
 app.add_middleware(RateLimitMiddleware)
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start = time.time()
-    response = await call_next(request)
-    duration = round(time.time() - start, 3)
-    if not request.url.path.startswith("/static") and not request.url.path.startswith("/img"):
-        logger.info("request | %s %s | %s | %.3fs", request.method, request.url.path, response.status_code, duration)
-    return response
+app.add_middleware(RequestLogMiddleware)
 
 
 app.include_router(router, prefix="/api")
@@ -231,38 +370,55 @@ if os.path.exists(static_dir):
     app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 
+# {path: (mtime_ns, content, etag)} -- HTML pages re-read only when they change
+_html_cache: dict = {}
+
+_HTML_HEADERS = {
+    "Cache-Control": "no-cache, no-store, must-revalidate, max-age=0",
+    "Pragma": "no-cache",
+    "Expires": "0",
+    "Vary": "Accept-Encoding",
+}
+
+
+def _read_html(path: str):
+    with open(path, "rb") as f:
+        content = f.read()
+    return content, f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+
+
+async def _static_html(name: str):
+    """Return (content, etag) for a static HTML page, cached by mtime.
+
+    Re-reading and hashing happen in a worker thread so a changed page
+    never blocks the event loop.
+    """
+    path = os.path.join(static_dir, name)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _html_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        content, etag = await asyncio.to_thread(_read_html, path)
+        cached = (mtime, content, etag)
+        _html_cache[path] = cached
+    return cached[1], cached[2]
+
+
+async def _html_response(request: Request, name: str) -> Response:
+    content, etag = await _static_html(name)
+    headers = {**_HTML_HEADERS, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="text/html", headers=headers)
+
+
 @app.get("/")
-async def root():
-    content = open(os.path.join(static_dir, "index.html"), "rb").read()
-    content_hash = hashlib.md5(content).hexdigest()[:12]
-    return Response(
-        content=content,
-        media_type="text/html",
-        headers={
-            "Cache-Control": "no-cache, no-store, must-revalidate, max-age=0",
-            "Pragma": "no-cache",
-            "Expires": "0",
-            "ETag": f'"{content_hash}"',
-            "Vary": "Accept-Encoding",
-        },
-    )
+async def root(request: Request):
+    return await _html_response(request, "index.html")
 
 
 @app.get("/analytics")
-async def analytics_page():
-    content = open(os.path.join(static_dir, "analytics.html"), "rb").read()
-    content_hash = hashlib.md5(content).hexdigest()[:12]
-    return Response(
-        content=content,
-        media_type="text/html",
-        headers={
-            "Cache-Control": "no-cache, no-store, must-revalidate, max-age=0",
-            "Pragma": "no-cache",
-            "Expires": "0",
-            "ETag": f'"{content_hash}"',
-            "Vary": "Accept-Encoding",
-        },
-    )
+async def analytics_page(request: Request):
+    return await _html_response(request, "analytics.html")
 
 
 @app.get("/health")
@@ -271,9 +427,7 @@ async def health():
     last_run = None
     if has_report:
         try:
-            with open(REPORT_PATH) as f:
-                data = json.load(f)
-                last_run = data.get("generated_at")
+            last_run = _report_last_run()
         except Exception:
             pass
     return {
@@ -289,7 +443,7 @@ async def health():
 @app.get("/api/pipeline-status")
 async def pipeline_status():
     """Return pipeline status including next update time."""
-    status = _load_status()
+    status = _status_cache
     return {
         "next_run": status.get("next_run"),
         "status": status.get("status", "unknown"),
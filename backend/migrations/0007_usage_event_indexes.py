@@ -0,0 +1,22 @@
+from yoyo import step
+
+steps = [
+    step(
+        """
+        CREATE INDEX IF NOT EXISTS idx_api_usage_log_key_ts ON api_usage_log(api_key_id, timestamp DESC);
+        DROP INDEX IF EXISTS idx_api_usage_log_api_key_id;
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_api_usage_log_api_key_id ON api_usage_log(api_key_id);
+        DROP INDEX IF EXISTS idx_api_usage_log_key_ts;
+        """
+    ),
+    step(
+        """
+        CREATE INDEX IF NOT EXISTS idx_events_app_created ON analytics_events(app, created_at DESC);
+        """,
+        """
+        DROP INDEX IF EXISTS idx_events_app_created;
+        """
+    ),
+]
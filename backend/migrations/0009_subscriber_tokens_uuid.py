@@ -0,0 +1,20 @@
+from yoyo import step
+
+steps = [
+    step(
+        """
+        ALTER TABLE email_subscribers
+            ALTER COLUMN verify_token TYPE UUID USING verify_token::uuid,
+            ALTER COLUMN unsubscribe_token TYPE UUID USING unsubscribe_token::uuid;
+        DROP INDEX IF EXISTS idx_subscribers_unsubscribe_token;
+        CREATE INDEX IF NOT EXISTS idx_subscribers_unsubscribe_token ON email_subscribers USING HASH (unsubscribe_token);
+        """,
+        """
+        DROP INDEX IF EXISTS idx_subscribers_unsubscribe_token;
+        ALTER TABLE email_subscribers
+            ALTER COLUMN verify_token TYPE TEXT USING verify_token::text,
+            ALTER COLUMN unsubscribe_token TYPE TEXT USING unsubscribe_token::text;
+        CREATE INDEX IF NOT EXISTS idx_subscribers_unsubscribe_token ON email_subscribers(unsubscribe_token);
+        """
+    ),
+]
@@ -9,12 +9,14 @@ Run locally before deploying to populate data/social_cache.json.
 Usage: python precollect_social.py
 """
 import asyncio
-import json
 import re
 import os
 import sys
 from datetime import datetime
 
+import ahocorasick
+import orjson
+
 SEARCH_QUERIES = [
     # Engagement-filtered general queries
     '"solana" min_faves:50',
@@ -39,6 +41,9 @@ SEARCH_QUERIES = [
     "from:rajgokal",
 ]
 
+# Search requests allowed in flight at once
+SEARCH_CONCURRENCY = 4
+
 SOLANA_KEYWORDS = [
     "solana", "sol", "defi", "nft", "anchor", "helius",
     "jupiter", "drift", "agent", "ai agent", "onchain",
@@ -46,8 +51,58 @@ SOLANA_KEYWORDS = [
     "backpack", "tensor", "pump.fun", "bonk", "wif",
 ]
 
+TOPIC_KEYWORDS = {
+    "defi": ["defi", "lending", "borrowing", "yield", "liquidity", "amm", "dex", "swap", "tvl"],
+    "ai_agents": ["ai agent", "agent", "autonomous", "llm", "gpt", "claude", "eliza"],
+    "trading": ["trading", "trade", "perp", "futures", "leverage"],
+    "infrastructure": ["rpc", "validator", "node", "infrastructure", "sdk"],
+    "memecoins": ["memecoin", "meme", "bonk", "wif", "pump", "degen"],
+    "staking": ["staking", "stake", "validator", "delegation", "msol", "jitosol"],
+    "nft": ["nft", "collection", "mint", "tensor", "magiceden"],
+    "gaming": ["gaming", "game", "play", "metaverse"],
+    "rwa": ["rwa", "real world", "tokenized", "treasury"],
+    "payments": ["payment", "pay", "transfer", "remittance"],
+}
+
 DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
 
+# A link line ("🔗 https://...") or a tweet header ("@handle (...")
+_XBIRD_LINE_RE = re.compile(r'🔗\s*(?P<url>https?://\S+)|@(?P<author>\w+)\s*\(')
+
+# Date and video lines carry nothing we keep
+_XBIRD_SKIP_PREFIXES = ("📅", "🎬")
+
+# Set SOCIAL_CACHE_INDENT=1 to write a human-readable cache file
+_CACHE_JSON_OPTS = orjson.OPT_APPEND_NEWLINE | (
+    orjson.OPT_INDENT_2 if os.environ.get("SOCIAL_CACHE_INDENT") else 0
+)
+
+
+def _build_solana_automaton() -> "ahocorasick.Automaton":
+    automaton = ahocorasick.Automaton()
+    for kw in SOLANA_KEYWORDS:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_topic_automaton() -> "ahocorasick.Automaton":
+    """Map each keyword to every topic that lists it (e.g. "validator")."""
+    keyword_topics = {}
+    for topic, keywords in TOPIC_KEYWORDS.items():
+        for kw in keywords:
+            keyword_topics.setdefault(kw, []).append(topic)
+    automaton = ahocorasick.Automaton()
+    for kw, topics in keyword_topics.items():
+        automaton.add_word(kw, tuple(topics))
+    automaton.make_automaton()
+    return automaton
+
+
+# Each tweet is scanned once per automaton instead of once per keyword
+_SOLANA_AUTOMATON = _build_solana_automaton()
+_TOPIC_AUTOMATON = _build_topic_automaton()
+
 
 def parse_xbird_output(output: str) -> list:
     """Parse xbird CLI output into structured tweets."""
@@ -63,22 +118,18 @@ def parse_xbird_output(output: str) -> list:
                 current_tweet = {}
             continue
         
-        if not line:
+        if not line or line.startswith(_XBIRD_SKIP_PREFIXES):
             continue
         
-        url_match = re.match(r'🔗\s*(https?://\S+)', line)
-        if url_match:
-            current_tweet["url"] = url_match.group(1)
-            continue
-        
-        if line.startswith("📅") or line.startswith("🎬"):
-            continue
-        
-        author_match = re.match(r'^@(\w+)\s*\(', line)
-        if author_match:
-            if current_tweet and current_tweet.get("text"):
-                tweets.append(current_tweet)
-            current_tweet = {"author": author_match.group(1), "text": ""}
+        m = _XBIRD_LINE_RE.match(line)
+        if m:
+            url, author = m.group("url", "author")
+            if url:
+                current_tweet["url"] = url
+            else:
+                if current_tweet and current_tweet.get("text"):
+                    tweets.append(current_tweet)
+                current_tweet = {"author": author, "text": ""}
             continue
         
         current_tweet["text"] = (current_tweet.get("text", "") + " " + line).strip()
@@ -89,30 +140,17 @@ def parse_xbird_output(output: str) -> list:
     return tweets
 
 
-def is_solana_related(text: str) -> bool:
-    text_lower = text.lower()
-    return any(kw in text_lower for kw in SOLANA_KEYWORDS)
-
-
-def extract_topics(text: str) -> list:
-    text_lower = text.lower()
-    topics = []
-    topic_keywords = {
-        "defi": ["defi", "lending", "borrowing", "yield", "liquidity", "amm", "dex", "swap", "tvl"],
-        "ai_agents": ["ai agent", "agent", "autonomous", "llm", "gpt", "claude", "eliza"],
-        "trading": ["trading", "trade", "perp", "futures", "leverage"],
-        "infrastructure": ["rpc", "validator", "node", "infrastructure", "sdk"],
-        "memecoins": ["memecoin", "meme", "bonk", "wif", "pump", "degen"],
-        "staking": ["staking", "stake", "validator", "delegation", "msol", "jitosol"],
-        "nft": ["nft", "collection", "mint", "tensor", "magiceden"],
-        "gaming": ["gaming", "game", "play", "metaverse"],
-        "rwa": ["rwa", "real world", "tokenized", "treasury"],
-        "payments": ["payment", "pay", "transfer", "remittance"],
-    }
-    for topic, keywords in topic_keywords.items():
-        if any(kw in text_lower for kw in keywords):
-            topics.append(topic)
-    return topics if topics else ["other"]
+def is_solana_related(text_lower: str) -> bool:
+    """Whether already-lowercased tweet text mentions a Solana keyword."""
+    return next(_SOLANA_AUTOMATON.iter(text_lower), None) is not None
+
+
+def extract_topics(text_lower: str) -> list:
+    """Topics mentioned in already-lowercased tweet text."""
+    found = set()
+    for _, topics in _TOPIC_AUTOMATON.iter(text_lower):
+        found.update(topics)
+    return [t for t in TOPIC_KEYWORDS if t in found] or ["other"]
 
 
 async def collect_home_timeline(count=50):
@@ -121,8 +159,10 @@ async def collect_home_timeline(count=50):
     signals = []
     try:
         tweets = await get_home_timeline(count)
+        now_iso = datetime.utcnow().isoformat()
         for t in tweets:
-            if is_solana_related(t.get("text", "")):
+            text_lower = t.get("text", "").lower()
+            if is_solana_related(text_lower):
                 signals.append({
                     "source": "twitter",
                     "signal_type": "kol_tweet",
@@ -130,8 +170,8 @@ async def collect_home_timeline(count=50):
                     "content": t.get("text", "")[:500],
                     "author": t.get("author", ""),
                     "url": t.get("url", ""),
-                    "topics": extract_topics(t.get("text", "")),
-                    "collected_at": datetime.utcnow().isoformat(),
+                    "topics": extract_topics(text_lower),
+                    "collected_at": now_iso,
                 })
     except Exception as e:
         logger.warning("Home timeline error: %s", e)
@@ -144,6 +184,7 @@ async def collect_search(query, count=20):
     signals = []
     try:
         tweets = await search_tweets(query, count)
+        now_iso = datetime.utcnow().isoformat()
         for t in tweets:
             signals.append({
                 "source": "twitter",
@@ -153,8 +194,8 @@ async def collect_search(query, count=20):
                 "content": t.get("text", "")[:500],
                 "author": t.get("author", ""),
                 "url": t.get("url", ""),
-                "topics": extract_topics(t.get("text", "")),
-                "collected_at": datetime.utcnow().isoformat(),
+                "topics": extract_topics(t.get("text", "").lower()),
+                "collected_at": now_iso,
             })
     except Exception as e:
         logger.warning("Search '%s' error: %s", query, e)
@@ -164,31 +205,34 @@ async def collect_search(query, count=20):
 async def async_main():
     os.makedirs(DATA_DIR, exist_ok=True)
     
-    all_signals = []
+    # Home timeline and searches run concurrently; searches are capped so we
+    # don't trip Twitter's rate limits
+    sem = asyncio.Semaphore(SEARCH_CONCURRENCY)
+    
+    async def _search(q):
+        async with sem:
+            logger.info("Searching: %s", q)
+            results = await collect_search(q, 20)
+        logger.info("%s results for %s", len(results), q)
+        return results
     
-    # Home timeline
     logger.info("Collecting home timeline...")
-    home = await collect_home_timeline(100)
+    home, *searches = await asyncio.gather(
+        collect_home_timeline(100),
+        *(_search(q) for q in SEARCH_QUERIES),
+    )
     logger.info("%s Solana-related tweets from home", len(home))
-    all_signals.extend(home)
-    
-    # Search queries
-    for q in SEARCH_QUERIES:
-        logger.info("Searching: %s", q)
-        results = await collect_search(q, 20)
-        logger.info("%s results", len(results))
-        all_signals.extend(results)
     
-    # Deduplicate by URL
-    seen_urls = set()
+    # Dedup by URL (or author + text for URL-less tweets) as we go
+    seen = set()
     unique = []
-    for s in all_signals:
-        url = s.get("url", "")
-        if url and url in seen_urls:
-            continue
-        if url:
-            seen_urls.add(url)
-        unique.append(s)
+    for results in (home, *searches):
+        for s in results:
+            key = s.get("url") or (s.get("author", ""), s.get("content", "")[:120])
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(s)
     
     cache = {
         "collected_at": datetime.utcnow().isoformat(),
@@ -197,8 +241,8 @@ async def async_main():
     }
     
     cache_path = os.path.join(DATA_DIR, "social_cache.json")
-    with open(cache_path, "w") as f:
-        json.dump(cache, f, indent=2)
+    with open(cache_path, "wb") as f:
+        f.write(orjson.dumps(cache, option=_CACHE_JSON_OPTS))
     
     logger.info("\nSaved %s signals to %s", len(unique), cache_path)
 
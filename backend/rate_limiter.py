@@ -9,13 +9,12 @@ import logging
 import os
 import secrets
 import time
-from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Optional, Tuple
 
 import asyncpg
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
 from starlette.responses import JSONResponse
 
 logger = logging.getLogger(__name__)
@@ -30,14 +29,38 @@ TIER_LIMITS = {
     "enterprise": None,  # unlimited
 }
 
-# In-memory rate counters: key -> list of timestamps
-_rate_counters: dict[str, list[float]] = defaultdict(list)
-_counter_lock = asyncio.Lock()
-
-# Cache of key_hash -> (id, tier) to avoid DB lookups on every request
-_key_cache: dict[str, Tuple[int, str]] = {}
-_key_cache_ttl: dict[str, float] = {}
+# In-memory rate counters: (key, hour bucket) -> requests made in that hour.
+# Capped so a flood of distinct clients can't grow it without bound; the
+# oldest counter is dropped first
+RATE_COUNTERS_MAX = 100_000
+_rate_counters: dict[Tuple[str, int], int] = {}
+# Hour bucket the counters were last evicted for
+_counters_bucket = 0
+
+# Cache of key_hash -> (expires_at, (id, tier)) to avoid DB lookups on every
+# request. Insertion-ordered, so the oldest entry is evicted past KEY_CACHE_MAX
+_key_cache: dict[str, Tuple[float, Tuple[int, str]]] = {}
 KEY_CACHE_TTL = 300  # 5 minutes
+KEY_CACHE_MAX = 10_000
+
+# Per-key request counts not yet written to api_keys
+KEY_USAGE_FLUSH_INTERVAL = 10
+_pending_key_usage: dict[int, int] = {}
+_key_usage_task: Optional[asyncio.Task] = None
+
+# Usage rows are buffered and written with COPY every USAGE_FLUSH_INTERVAL
+# seconds, or as soon as USAGE_BATCH_SIZE are queued
+USAGE_FLUSH_INTERVAL = 0.5
+USAGE_BATCH_SIZE = 256
+
+_USAGE_COLUMNS = (
+    "api_key_id", "ip_hash", "endpoint", "method",
+    "timestamp", "response_time_ms", "status_code",
+)
+
+_usage_buffer: list = []
+_usage_flush_task: Optional[asyncio.Task] = None
+_usage_buffer_full: Optional[asyncio.Event] = None
 
 # DB pool
 _pool: Optional[asyncpg.Pool] = None
@@ -57,7 +80,7 @@ def hash_key(raw_key: str) -> str:
 
 
 def hash_ip(ip: str) -> str:
-    return hashlib.sha256(f"snr-rl-{ip}".encode()).hexdigest()[:16]
+    return hashlib.blake2b(f"snr-rl-{ip}".encode(), digest_size=8).hexdigest()
 
 
 def generate_api_key() -> str:
@@ -66,9 +89,12 @@ def generate_api_key() -> str:
 
 async def lookup_api_key(key_hash: str) -> Optional[Tuple[int, str]]:
     """Returns (id, tier) or None."""
-    now = time.time()
-    if key_hash in _key_cache and _key_cache_ttl.get(key_hash, 0) > now:
-        return _key_cache[key_hash]
+    now = time.monotonic()
+    cached = _key_cache.get(key_hash)
+    if cached is not None and cached[0] > now:
+        result = cached[1]
+        _record_key_use(result[0])
+        return result
 
     try:
         pool = await get_pool()
@@ -79,46 +105,100 @@ async def lookup_api_key(key_hash: str) -> Optional[Tuple[int, str]]:
         )
         if row:
             result = (row["id"], row["tier"])
-            _key_cache[key_hash] = result
-            _key_cache_ttl[key_hash] = now + KEY_CACHE_TTL
-            # Update last_used_at (fire and forget)
-            asyncio.create_task(_update_last_used(pool, row["id"]))
+            _key_cache.pop(key_hash, None)
+            _key_cache[key_hash] = (now + KEY_CACHE_TTL, result)
+            if len(_key_cache) > KEY_CACHE_MAX:
+                del _key_cache[next(iter(_key_cache))]
+            _record_key_use(row["id"])
             return result
     except Exception as e:
         logger.warning(f"API key lookup failed: {e}")
     return None
 
 
-async def _update_last_used(pool, key_id: int):
+def _record_key_use(key_id: int):
+    """Count a request against a key; counts reach api_keys in periodic batches."""
+    global _key_usage_task
+    _pending_key_usage[key_id] = _pending_key_usage.get(key_id, 0) + 1
+    if _key_usage_task is None or _key_usage_task.done():
+        _key_usage_task = asyncio.create_task(_key_usage_flush_loop())
+
+
+async def _key_usage_flush_loop():
+    while _pending_key_usage:
+        await asyncio.sleep(KEY_USAGE_FLUSH_INTERVAL)
+        await flush_key_usage()
+
+
+async def flush_key_usage():
+    """Apply pending per-key request counts to api_keys in one UPDATE."""
+    global _pending_key_usage
+    if not _pending_key_usage:
+        return
+    pending, _pending_key_usage = _pending_key_usage, {}
     try:
+        pool = await get_pool()
         await pool.execute(
-            "UPDATE api_keys SET last_used_at = NOW(), requests_today = requests_today + 1, requests_total = requests_total + 1 WHERE id = $1",
-            key_id,
+            """UPDATE api_keys SET last_used_at = NOW(),
+                   requests_today = requests_today + d.n,
+                   requests_total = requests_total + d.n
+               FROM unnest($1::int[], $2::int[]) AS d(id, n)
+               WHERE api_keys.id = d.id""",
+            list(pending.keys()), list(pending.values()),
         )
-    except Exception:
-        pass
+    except Exception as e:
+        logger.warning(f"API key usage update failed: {e}")
 
 
-async def log_usage(api_key_id: Optional[int], ip_hash: str, endpoint: str, method: str, response_time_ms: int, status_code: int):
+def log_usage(api_key_id: Optional[int], ip_hash: str, endpoint: str, method: str, response_time_ms: int, status_code: int):
+    """Queue a usage row; a background task writes queued rows in batches."""
+    global _usage_flush_task, _usage_buffer_full
+    if not DATABASE_URL:
+        return
+    _usage_buffer.append((
+        api_key_id, ip_hash, endpoint, method,
+        datetime.now(timezone.utc), response_time_ms, status_code,
+    ))
+    if _usage_flush_task is None or _usage_flush_task.done():
+        _usage_buffer_full = asyncio.Event()
+        _usage_flush_task = asyncio.create_task(_usage_flush_loop())
+    if len(_usage_buffer) >= USAGE_BATCH_SIZE:
+        _usage_buffer_full.set()
+
+
+async def _usage_flush_loop():
+    """Flush queued usage rows until the buffer stays empty."""
+    while _usage_buffer:
+        try:
+            await asyncio.wait_for(_usage_buffer_full.wait(), USAGE_FLUSH_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        _usage_buffer_full.clear()
+        await flush_usage_log()
+
+
+async def flush_usage_log():
+    """Write all queued usage rows to api_usage_log with a single COPY."""
+    global _usage_buffer
+    if not _usage_buffer:
+        return
+    batch, _usage_buffer = _usage_buffer, []
     try:
         pool = await get_pool()
-        if pool is None:
-            return
-        await pool.execute(
-            """INSERT INTO api_usage_log (api_key_id, ip_hash, endpoint, method, timestamp, response_time_ms, status_code)
-               VALUES ($1, $2, $3, $4, NOW(), $5, $6)""",
-            api_key_id, ip_hash, endpoint, method, response_time_ms, status_code,
-        )
+        await pool.copy_records_to_table("api_usage_log", records=batch, columns=_USAGE_COLUMNS)
     except Exception as e:
-        logger.warning(f"Usage log failed: {e}")
+        logger.warning(f"Usage log failed, dropped {len(batch)} rows: {e}")
 
 
-def _prune_and_count(counter_key: str, window: float = 3600.0) -> int:
-    """Prune old entries and return current count."""
-    now = time.time()
-    timestamps = _rate_counters[counter_key]
-    _rate_counters[counter_key] = [t for t in timestamps if now - t < window]
-    return len(_rate_counters[counter_key])
+def _hour_bucket() -> int:
+    """Index of the current clock hour; counters reset when it changes."""
+    global _counters_bucket
+    bucket = int(time.time()) // 3600
+    if bucket != _counters_bucket:
+        for k in [k for k in _rate_counters if k[1] < bucket]:
+            del _rate_counters[k]
+        _counters_bucket = bucket
+    return bucket
 
 
 def _get_reset_time() -> int:
@@ -134,15 +214,28 @@ SKIP_PATHS = {"/", "/health", "/docs", "/openapi.json", "/redoc"}
 FRONTEND_SKIP_PREFIXES = ("/img/", "/assets/", "/static/", "/api/pipeline-status", "/api/analytics", "/api/narratives")
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        path = request.url.path
-        
+class RateLimitMiddleware:
+    """Per-tier hourly rate limiting and usage logging, as plain ASGI middleware.
+
+    Skipped paths are passed straight through without building a Request.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+
         # Skip static files, non-API paths, and frontend-essential endpoints
-        if path in SKIP_PATHS or any(path.startswith(p) for p in FRONTEND_SKIP_PREFIXES):
-            return await call_next(request)
+        if path in SKIP_PATHS or path.startswith(FRONTEND_SKIP_PREFIXES):
+            await self.app(scope, receive, send)
+            return
 
-        start_time = time.time()
+        request = Request(scope)
+        start_ns = time.monotonic_ns()
         client_ip = request.client.host if request.client else "0.0.0.0"
         ip_hash_val = hash_ip(client_ip)
 
@@ -164,42 +257,52 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         limit = TIER_LIMITS.get(tier)
         remaining = None
         if limit is not None:
-            async with _counter_lock:
-                count = _prune_and_count(counter_key)
-                if count >= limit:
-                    reset = _get_reset_time()
-                    # Log the 429
-                    elapsed_ms = int((time.time() - start_time) * 1000)
-                    asyncio.create_task(log_usage(api_key_id, ip_hash_val, path, request.method, elapsed_ms, 429))
-                    resp = JSONResponse(
-                        {"detail": "Rate limit exceeded", "retry_after": reset},
-                        status_code=429,
-                    )
-                    resp.headers["Retry-After"] = str(reset)
-                    resp.headers["X-RateLimit-Limit"] = str(limit)
-                    resp.headers["X-RateLimit-Remaining"] = "0"
-                    resp.headers["X-RateLimit-Reset"] = str(reset)
-                    return resp
-                _rate_counters[counter_key].append(time.time())
-                remaining = limit - count - 1
+            # No await between the check and the increment, so this is atomic
+            # on the event loop without a lock
+            counter = (counter_key, _hour_bucket())
+            count = _rate_counters.get(counter, 0)
+            if count >= limit:
+                reset = _get_reset_time()
+                # Log the 429
+                elapsed_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+                log_usage(api_key_id, ip_hash_val, path, request.method, elapsed_ms, 429)
+                resp = JSONResponse(
+                    {"detail": "Rate limit exceeded", "retry_after": reset},
+                    status_code=429,
+                )
+                resp.headers["Retry-After"] = str(reset)
+                resp.headers["X-RateLimit-Limit"] = str(limit)
+                resp.headers["X-RateLimit-Remaining"] = "0"
+                resp.headers["X-RateLimit-Reset"] = str(reset)
+                await resp(scope, receive, send)
+                return
+            if not count and len(_rate_counters) >= RATE_COUNTERS_MAX:
+                del _rate_counters[next(iter(_rate_counters))]
+            _rate_counters[counter] = count + 1
+            remaining = limit - count - 1
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add rate limit headers
+                headers = MutableHeaders(scope=message)
+                if limit is not None:
+                    headers["X-RateLimit-Limit"] = str(limit)
+                    headers["X-RateLimit-Remaining"] = str(max(0, remaining or 0))
+                    headers["X-RateLimit-Reset"] = str(_get_reset_time())
+                else:
+                    headers["X-RateLimit-Limit"] = "unlimited"
+            await send(message)
 
         # Process request
-        response: Response = await call_next(request)
-
-        # Add rate limit headers
-        reset = _get_reset_time()
-        if limit is not None:
-            response.headers["X-RateLimit-Limit"] = str(limit)
-            response.headers["X-RateLimit-Remaining"] = str(max(0, remaining or 0))
-            response.headers["X-RateLimit-Reset"] = str(reset)
-        else:
-            response.headers["X-RateLimit-Limit"] = "unlimited"
+        await self.app(scope, receive, send_wrapper)
 
         # Log usage async
-        elapsed_ms = int((time.time() - start_time) * 1000)
-        asyncio.create_task(log_usage(api_key_id, ip_hash_val, path, request.method, elapsed_ms, response.status_code))
-
-        return response
+        elapsed_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+        log_usage(api_key_id, ip_hash_val, path, request.method, elapsed_ms, status_code)
 
 
 # ── API Key Management ──
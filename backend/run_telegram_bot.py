@@ -26,7 +26,7 @@ logger = logging.getLogger(__name__)
 from telegram_bot import (
     subscribe, unsubscribe, send_message,
     _build_status_message, _build_narratives_message, get_subscriber_count,
-    RADAR_URL, _escape_md,
+    RADAR_URL,
 )
 
 TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN", "")
@@ -35,10 +35,10 @@ TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN", "")
 async def cmd_start(update: Update, context):
     chat_id = update.effective_chat.id
     username = update.effective_user.username if update.effective_user else None
-    is_new = subscribe(chat_id, username)
+    is_new = await subscribe(chat_id, username)
     if is_new:
         reply = (
-            "✅ *Subscribed to Solana Narrative Radar!*\n\n"
+            "✅ <b>Subscribed to Solana Narrative Radar!</b>\n\n"
             "You'll receive alerts when:\n"
             "• 🆕 New narratives are detected\n"
             "• 📈 Narratives change direction\n"
@@ -52,29 +52,29 @@ async def cmd_start(update: Update, context):
         )
     else:
         reply = "👋 Welcome back! You're already subscribed."
-    await update.message.reply_markdown(reply)
+    await update.message.reply_html(reply)
 
 
 async def cmd_stop(update: Update, context):
-    was_active = unsubscribe(update.effective_chat.id)
+    was_active = await unsubscribe(update.effective_chat.id)
     reply = "🔕 Unsubscribed. Use /start to re-subscribe anytime." if was_active else "You weren't subscribed. Use /start to subscribe."
     await update.message.reply_text(reply)
 
 
 async def cmd_status(update: Update, context):
     msg = await _build_status_message()
-    await update.message.reply_markdown(msg)
+    await update.message.reply_html(msg)
 
 
 async def cmd_narratives(update: Update, context):
     msg = await _build_narratives_message()
-    await update.message.reply_markdown(msg)
+    await update.message.reply_html(msg)
 
 
 async def cmd_alerts(update: Update, context):
-    count = get_subscriber_count()
+    count = await get_subscriber_count()
     reply = (
-        "🔔 *Alert Settings*\n\n"
+        "🔔 <b>Alert Settings</b>\n\n"
         "Currently sending alerts for:\n"
         "• 🆕 New narrative detection\n"
         "• 📈 Direction changes\n"
@@ -83,19 +83,19 @@ async def cmd_alerts(update: Update, context):
         f"Active subscribers: {count}\n"
         "Pipeline runs every 2 hours."
     )
-    await update.message.reply_markdown(reply)
+    await update.message.reply_html(reply)
 
 
 async def fallback(update: Update, context):
     reply = (
-        "🔭 *Solana Narrative Radar Bot*\n\n"
+        "🔭 <b>Solana Narrative Radar Bot</b>\n\n"
         "/start — Subscribe to alerts\n"
         "/stop — Unsubscribe\n"
         "/status — Current summary\n"
         "/narratives — Active narratives\n"
         "/alerts — Alert settings"
     )
-    await update.message.reply_markdown(reply)
+    await update.message.reply_html(reply)
 
 
 def main():
@@ -3,14 +3,20 @@
 Supports both webhook mode (production) and polling mode (development).
 Bot token from TELEGRAM_BOT_TOKEN env var.
 """
-import json
+import asyncio
+import html
 import logging
 import os
+import time
+from collections import Counter
 from datetime import datetime, timezone
 from typing import List, Optional, Dict
 
+import asyncpg
 import httpx
-import psycopg2
+import orjson
+
+from engine.narrative_store import load_store, get_active_narratives
 
 logger = logging.getLogger(__name__)
 
@@ -18,88 +24,152 @@ DATABASE_URL = os.environ.get("DATABASE_URL", "")
 TELEGRAM_BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN", "")
 RADAR_URL = "https://solana-narrative-radar-8vsib.ondigitalocean.app"
 
+# Sends in flight at once; caps concurrency only, _wait_send_slot paces them
+_send_semaphore = asyncio.Semaphore(25)
+# Spacing between sendMessage calls, keeping the bot under Telegram's ~30 msg/s
+GLOBAL_SEND_INTERVAL = 1 / 30
+_next_send_at = 0.0
+# Telegram allows about one message per second to the same chat
+PER_CHAT_SEND_INTERVAL = 1.05
+# Attempts per message across 429/5xx retries
+SEND_MAX_ATTEMPTS = 3
+
 # ── DB helpers ──
 
-def _get_conn():
-    return psycopg2.connect(DATABASE_URL)
+_pool: Optional[asyncpg.Pool] = None
+
+# (fetched_at, chat_ids) for get_active_chat_ids; cleared on (un)subscribe
+_chat_ids_cache: Optional[tuple] = None
+CHAT_IDS_CACHE_TTL = 60
+
+# Fixed query text so asyncpg's per-connection statement cache reuses the plans
+_SUBSCRIBE_SQL = """
+    INSERT INTO telegram_subscribers (chat_id, username, active)
+    VALUES ($1, $2, TRUE)
+    ON CONFLICT (chat_id) DO UPDATE SET active = TRUE, username = COALESCE(EXCLUDED.username, telegram_subscribers.username)
+    RETURNING (xmax = 0) AS is_new
+"""
+_UNSUBSCRIBE_SQL = """
+    UPDATE telegram_subscribers SET active = FALSE WHERE chat_id = $1 AND active = TRUE
+    RETURNING id
+"""
+_ACTIVE_CHAT_IDS_SQL = "SELECT chat_id FROM telegram_subscribers WHERE active = TRUE"
+
+
+async def get_pool() -> asyncpg.Pool:
+    global _pool
+    if _pool is None or _pool.is_closing():
+        _pool = await asyncpg.create_pool(DATABASE_URL, min_size=2, max_size=10)
+    return _pool
 
 
-def subscribe(chat_id: int, username: Optional[str] = None) -> bool:
+async def close_pool():
+    """Close the subscriber DB pool."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+async def subscribe(chat_id: int, username: Optional[str] = None) -> bool:
     """Subscribe a chat. Returns True if new, False if already subscribed."""
-    conn = _get_conn()
-    try:
-        with conn.cursor() as cur:
-            cur.execute("""
-                INSERT INTO telegram_subscribers (chat_id, username, active)
-                VALUES (%s, %s, TRUE)
-                ON CONFLICT (chat_id) DO UPDATE SET active = TRUE, username = COALESCE(EXCLUDED.username, telegram_subscribers.username)
-                RETURNING (xmax = 0) AS is_new
-            """, (chat_id, username))
-            is_new = cur.fetchone()[0]
-        conn.commit()
-        return is_new
-    finally:
-        conn.close()
-
-
-def unsubscribe(chat_id: int) -> bool:
+    global _chat_ids_cache
+    pool = await get_pool()
+    is_new = await pool.fetchval(_SUBSCRIBE_SQL, chat_id, username)
+    _chat_ids_cache = None
+    return is_new
+
+
+async def unsubscribe(chat_id: int) -> bool:
     """Unsubscribe a chat. Returns True if was active."""
-    conn = _get_conn()
-    try:
-        with conn.cursor() as cur:
-            cur.execute("""
-                UPDATE telegram_subscribers SET active = FALSE WHERE chat_id = %s AND active = TRUE
-                RETURNING id
-            """, (chat_id,))
-            result = cur.fetchone()
-        conn.commit()
-        return result is not None
-    finally:
-        conn.close()
-
-
-def get_active_chat_ids() -> List[int]:
-    """Get all active subscriber chat IDs."""
-    conn = _get_conn()
-    try:
-        with conn.cursor() as cur:
-            cur.execute("SELECT chat_id FROM telegram_subscribers WHERE active = TRUE")
-            return [row[0] for row in cur.fetchall()]
-    finally:
-        conn.close()
+    global _chat_ids_cache
+    pool = await get_pool()
+    result = await pool.fetchval(_UNSUBSCRIBE_SQL, chat_id)
+    _chat_ids_cache = None
+    return result is not None
 
 
-def get_subscriber_count() -> int:
-    conn = _get_conn()
-    try:
-        with conn.cursor() as cur:
-            cur.execute("SELECT COUNT(*) FROM telegram_subscribers WHERE active = TRUE")
-            return cur.fetchone()[0]
-    finally:
-        conn.close()
+async def get_active_chat_ids() -> List[int]:
+    """Get all active subscriber chat IDs (cached for CHAT_IDS_CACHE_TTL seconds)."""
+    global _chat_ids_cache
+    now = time.monotonic()
+    if _chat_ids_cache and now - _chat_ids_cache[0] < CHAT_IDS_CACHE_TTL:
+        return _chat_ids_cache[1]
+    pool = await get_pool()
+    rows = await pool.fetch(_ACTIVE_CHAT_IDS_SQL)
+    chat_ids = [row["chat_id"] for row in rows]
+    _chat_ids_cache = (now, chat_ids)
+    return chat_ids
+
+
+async def get_subscriber_count() -> int:
+    """Active subscriber count, served from the chat id cache."""
+    return len(await get_active_chat_ids())
 
 
 # ── Telegram API ──
 
-async def send_message(chat_id: int, text: str, parse_mode: str = "Markdown") -> bool:
+# Shared client so sends reuse pooled keep-alive connections to Telegram
+_client: Optional[httpx.AsyncClient] = None
+# Bodies are pre-encoded with orjson, so the content type is set by hand
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url="https://api.telegram.org",
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared Telegram HTTP client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def _wait_send_slot():
+    """Reserve the next global send slot and sleep until it comes up."""
+    global _next_send_at
+    now = time.monotonic()
+    slot = max(now, _next_send_at)
+    _next_send_at = slot + GLOBAL_SEND_INTERVAL
+    if slot > now:
+        await asyncio.sleep(slot - now)
+
+
+async def send_message(chat_id: int, text: str, parse_mode: str = "HTML") -> bool:
     """Send a message via Telegram Bot API."""
     if not TELEGRAM_BOT_TOKEN:
         logger.warning("TELEGRAM_BOT_TOKEN not set, skipping send")
         return False
-    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-    payload = {"chat_id": chat_id, "text": text, "parse_mode": parse_mode, "disable_web_page_preview": True}
+    url = f"/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+    payload = orjson.dumps({"chat_id": chat_id, "text": text, "parse_mode": parse_mode, "disable_web_page_preview": True})
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.post(url, json=payload)
+        client = _get_client()
+        for attempt in range(SEND_MAX_ATTEMPTS):
+            await _wait_send_slot()
+            resp = await client.post(url, content=payload, headers=_JSON_HEADERS)
             if resp.status_code == 200:
                 return True
-            # If Markdown fails, retry without parse_mode
-            if resp.status_code == 400 and "parse" in resp.text.lower():
-                payload["parse_mode"] = None
-                resp = await client.post(url, json=payload)
-                return resp.status_code == 200
-            logger.error("Telegram send failed: %s %s", resp.status_code, resp.text)
-            return False
+            last_attempt = attempt == SEND_MAX_ATTEMPTS - 1
+            # Flood control: wait as long as Telegram asks before retrying
+            if resp.status_code == 429 and not last_attempt:
+                retry_after = resp.json().get("parameters", {}).get("retry_after", 1)
+                await asyncio.sleep(retry_after + 0.1)
+                continue
+            if resp.status_code >= 500 and not last_attempt:
+                await asyncio.sleep(0.5 * 2 ** attempt)
+                continue
+            break
+        logger.error("Telegram send failed: %s %s", resp.status_code, resp.text)
+        return False
     except Exception as e:
         logger.error("Telegram send error: %s", e)
         return False
@@ -107,36 +177,55 @@ async def send_message(chat_id: int, text: str, parse_mode: str = "Markdown") ->
 
 async def broadcast(text: str) -> Dict[str, int]:
     """Send a message to all active subscribers. Returns success/fail counts."""
-    chat_ids = get_active_chat_ids()
-    sent, failed = 0, 0
-    for chat_id in chat_ids:
-        ok = await send_message(chat_id, text)
-        if ok:
-            sent += 1
-        else:
-            failed += 1
+    if not TELEGRAM_BOT_TOKEN:
+        logger.warning("TELEGRAM_BOT_TOKEN not set, skipping broadcast")
+        return {"sent": 0, "failed": 0, "total": 0}
+    chat_ids = await get_active_chat_ids()
+    if not chat_ids:
+        return {"sent": 0, "failed": 0, "total": 0}
+
+    async def _send_guarded(chat_id: int) -> bool:
+        async with _send_semaphore:
+            return await send_message(chat_id, text)
+
+    results = await asyncio.gather(*(_send_guarded(c) for c in chat_ids), return_exceptions=True)
+    sent = sum(1 for r in results if r is True)
+    failed = len(chat_ids) - sent
     logger.info("Telegram broadcast: %d sent, %d failed out of %d", sent, failed, len(chat_ids))
     return {"sent": sent, "failed": failed, "total": len(chat_ids)}
 
 
 # ── Alert formatters ──
 
+# Templates are built once at import with the radar link already appended
+_RADAR_LINK = f'<a href="{RADAR_URL}">View on Radar</a>'
+_NEW_NARRATIVE_TPL = (
+    "🆕 <b>New Narrative Detected</b>\n\n"
+    "<b>{name}</b>\n"
+    "Confidence: {confidence} | Direction: {direction}\n\n" + _RADAR_LINK
+)
+_DIRECTION_CHANGE_TPL = (
+    "📈 <b>Direction Change</b>\n\n"
+    "<b>{name}</b>\n"
+    "{old} → {new}\n\n" + _RADAR_LINK
+)
+_FADED_TPL = (
+    "👻 <b>Narrative Faded</b>\n\n"
+    "<b>{name}</b> has faded after {age}\n\n" + _RADAR_LINK
+)
+_HIGH_CONFIDENCE_TPL = (
+    "🔥 <b>High Confidence Narrative</b>\n\n"
+    "<b>{name}</b> has reached HIGH confidence\n"
+    "Direction: {direction}\n\n" + _RADAR_LINK
+)
+
+
 def format_new_narrative(name: str, confidence: str, direction: str) -> str:
-    return (
-        f"🆕 *New Narrative Detected*\n\n"
-        f"*{_escape_md(name)}*\n"
-        f"Confidence: {confidence} | Direction: {direction}\n\n"
-        f"[View on Radar]({RADAR_URL})"
-    )
+    return _NEW_NARRATIVE_TPL.format(name=_escape_html(name), confidence=confidence, direction=direction)
 
 
 def format_direction_change(name: str, old_direction: str, new_direction: str) -> str:
-    return (
-        f"📈 *Direction Change*\n\n"
-        f"*{_escape_md(name)}*\n"
-        f"{old_direction} → {new_direction}\n\n"
-        f"[View on Radar]({RADAR_URL})"
-    )
+    return _DIRECTION_CHANGE_TPL.format(name=_escape_html(name), old=old_direction, new=new_direction)
 
 
 def format_narrative_faded(name: str, age_hours: int) -> str:
@@ -144,27 +233,16 @@ def format_narrative_faded(name: str, age_hours: int) -> str:
         age_str = f"{age_hours}h"
     else:
         age_str = f"{age_hours // 24}d"
-    return (
-        f"👻 *Narrative Faded*\n\n"
-        f"*{_escape_md(name)}* has faded after {age_str}\n\n"
-        f"[View on Radar]({RADAR_URL})"
-    )
+    return _FADED_TPL.format(name=_escape_html(name), age=age_str)
 
 
 def format_high_confidence(name: str, direction: str) -> str:
-    return (
-        f"🔥 *High Confidence Narrative*\n\n"
-        f"*{_escape_md(name)}* has reached HIGH confidence\n"
-        f"Direction: {direction}\n\n"
-        f"[View on Radar]({RADAR_URL})"
-    )
+    return _HIGH_CONFIDENCE_TPL.format(name=_escape_html(name), direction=direction)
 
 
-def _escape_md(text: str) -> str:
-    """Escape Markdown v1 special chars."""
-    for ch in ['_', '*', '`', '[']:
-        text = text.replace(ch, f'\\{ch}')
-    return text
+def _escape_html(text: str) -> str:
+    """Escape text for Telegram's HTML parse mode."""
+    return html.escape(text, quote=False)
 
 
 # ── Notification dispatcher (called from narrative_store after merge) ──
@@ -176,30 +254,55 @@ async def notify_narrative_changes(
     high_confidence_new: List[Dict],
 ):
     """Send alerts for all narrative changes. Called after merge_narratives."""
+    # The store just changed; rebuild /status and /narratives on next request
+    _reply_cache.clear()
     if not TELEGRAM_BOT_TOKEN or not DATABASE_URL:
         return
 
-    for n in new_narratives:
-        msg = format_new_narrative(n["name"], n.get("confidence", "MEDIUM"), n.get("direction", "EMERGING"))
-        await broadcast(msg)
+    messages = (
+        [format_new_narrative(n["name"], n.get("confidence", "MEDIUM"), n.get("direction", "EMERGING")) for n in new_narratives]
+        + [format_direction_change(n["name"], n["old_direction"], n["new_direction"]) for n in direction_changes]
+        + [format_narrative_faded(n["name"], n.get("age_hours", 0)) for n in faded_narratives]
+        + [format_high_confidence(n["name"], n.get("direction", "EMERGING")) for n in high_confidence_new]
+    )
+    # Identical alerts are sent once
+    messages = list(dict.fromkeys(messages))
+    if not messages:
+        return
 
-    for n in direction_changes:
-        msg = format_direction_change(n["name"], n["old_direction"], n["new_direction"])
-        await broadcast(msg)
+    chat_ids = await get_active_chat_ids()
+    if not chat_ids:
+        return
+    results = await asyncio.gather(*(_send_paced(c, messages) for c in chat_ids), return_exceptions=True)
+    sent = sum(r for r in results if isinstance(r, int))
+    logger.info("Telegram alerts: %d messages, %d sends to %d chats", len(messages), sent, len(chat_ids))
 
-    for n in faded_narratives:
-        msg = format_narrative_faded(n["name"], n.get("age_hours", 0))
-        await broadcast(msg)
 
-    for n in high_confidence_new:
-        msg = format_high_confidence(n["name"], n.get("direction", "EMERGING"))
-        await broadcast(msg)
+async def _send_paced(chat_id: int, messages: List[str]) -> int:
+    """Send messages to one chat in order, spaced out for the per-chat limit."""
+    sent = 0
+    for i, msg in enumerate(messages):
+        if i:
+            await asyncio.sleep(PER_CHAT_SEND_INTERVAL)
+        async with _send_semaphore:
+            if await send_message(chat_id, msg):
+                sent += 1
+    return sent
 
 
 # ── Webhook handler (called from FastAPI route) ──
 
 async def handle_webhook_update(update: dict) -> str:
     """Process an incoming Telegram webhook update."""
+    try:
+        return await _handle_update(update)
+    except Exception:
+        # Runs as a background task, so nothing upstream would report it
+        logger.exception("Telegram webhook update failed")
+        return "error"
+
+
+async def _handle_update(update: dict) -> str:
     message = update.get("message", {})
     if not message:
         return "ok"
@@ -212,10 +315,10 @@ async def handle_webhook_update(update: dict) -> str:
         return "ok"
 
     if text == "/start":
-        is_new = subscribe(chat_id, username)
+        is_new = await subscribe(chat_id, username)
         if is_new:
             reply = (
-                "✅ *Subscribed to Solana Narrative Radar!*\n\n"
+                "✅ <b>Subscribed to Solana Narrative Radar!</b>\n\n"
                 "You'll receive alerts when:\n"
                 "• 🆕 New narratives are detected\n"
                 "• 📈 Narratives change direction\n"
@@ -232,7 +335,7 @@ async def handle_webhook_update(update: dict) -> str:
         await send_message(chat_id, reply)
 
     elif text == "/stop":
-        was_active = unsubscribe(chat_id)
+        was_active = await unsubscribe(chat_id)
         if was_active:
             reply = "🔕 Unsubscribed. Use /start to re-subscribe anytime."
         else:
@@ -248,9 +351,9 @@ async def handle_webhook_update(update: dict) -> str:
         await send_message(chat_id, reply)
 
     elif text == "/alerts":
-        count = get_subscriber_count()
+        count = await get_subscriber_count()
         reply = (
-            "🔔 *Alert Settings*\n\n"
+            "🔔 <b>Alert Settings</b>\n\n"
             "Currently sending alerts for:\n"
             "• 🆕 New narrative detection\n"
             "• 📈 Direction changes\n"
@@ -263,7 +366,7 @@ async def handle_webhook_update(update: dict) -> str:
 
     else:
         reply = (
-            "🔭 *Solana Narrative Radar Bot*\n\n"
+            "🔭 <b>Solana Narrative Radar Bot</b>\n\n"
             "/start — Subscribe to alerts\n"
             "/stop — Unsubscribe\n"
             "/status — Current summary\n"
@@ -275,28 +378,71 @@ async def handle_webhook_update(update: dict) -> str:
     return "ok"
 
 
+# Formatted /status and /narratives replies: key -> (built_at, text)
+_reply_cache: Dict[str, tuple] = {}
+_reply_lock = asyncio.Lock()
+REPLY_CACHE_TTL = 60
+
+
+async def _cached_reply(key: str, render) -> str:
+    """Return a cached reply, rendering it at most once per TTL."""
+    entry = _reply_cache.get(key)
+    if entry and time.monotonic() - entry[0] < REPLY_CACHE_TTL:
+        return entry[1]
+    async with _reply_lock:
+        # Another request may have rendered it while we waited
+        entry = _reply_cache.get(key)
+        if entry and time.monotonic() - entry[0] < REPLY_CACHE_TTL:
+            return entry[1]
+        text = await asyncio.to_thread(render)
+        _reply_cache[key] = (time.monotonic(), text)
+        return text
+
+
+def _render_status_message() -> str:
+    store = load_store()
+    active = get_active_narratives(store)
+    total = store.get("total_pipeline_runs", 0)
+
+    counts = Counter(n.get("current_confidence") for n in active)
+    high, medium, low = counts["HIGH"], counts["MEDIUM"], counts["LOW"]
+
+    return (
+        f"📊 <b>Narrative Radar Status</b>\n\n"
+        f"Active narratives: {len(active)}\n"
+        f"• HIGH confidence: {high}\n"
+        f"• MEDIUM confidence: {medium}\n"
+        f"• LOW confidence: {low}\n\n"
+        f"Total pipeline runs: {total}\n"
+        f"Last updated: {store.get('last_updated', 'unknown')}\n\n"
+        f'<a href="{RADAR_URL}">Open Radar</a>'
+    )
+
+
+def _render_narratives_message() -> str:
+    store = load_store()
+    active = get_active_narratives(store)
+
+    if not active:
+        return "No active narratives detected yet. Check back after the next pipeline run."
+
+    lines = ["📡 <b>Active Narratives</b>\n"]
+    for n in active[:15]:  # Cap at 15 to avoid message length limits
+        name = _escape_html(n.get("name", "?"))
+        conf = n.get("current_confidence", "?")
+        direction = n.get("current_direction", "?")
+        count = n.get("detection_count", 0)
+        emoji = {"HIGH": "🔴", "MEDIUM": "🟡", "LOW": "⚪"}.get(conf, "⚪")
+        lines.append(f"{emoji} <b>{name}</b>\n   {conf} | {direction} | seen {count}x")
+
+    lines.append(f'\n<a href="{RADAR_URL}">View all on Radar</a>')
+    return "\n".join(lines)
+
+
 async def _build_status_message() -> str:
     """Build a status summary message."""
     try:
-        from engine.narrative_store import load_store, get_active_narratives
-        store = load_store()
-        active = get_active_narratives(store)
-        total = store.get("total_pipeline_runs", 0)
-
-        high = sum(1 for n in active if n.get("current_confidence") == "HIGH")
-        medium = sum(1 for n in active if n.get("current_confidence") == "MEDIUM")
-        low = sum(1 for n in active if n.get("current_confidence") == "LOW")
-
-        return (
-            f"📊 *Narrative Radar Status*\n\n"
-            f"Active narratives: {len(active)}\n"
-            f"• HIGH confidence: {high}\n"
-            f"• MEDIUM confidence: {medium}\n"
-            f"• LOW confidence: {low}\n\n"
-            f"Total pipeline runs: {total}\n"
-            f"Last updated: {store.get('last_updated', 'unknown')}\n\n"
-            f"[Open Radar]({RADAR_URL})"
-        )
+        return await _cached_reply("status", _render_status_message)
     except Exception as e:
         logger.error("Status message error: %s", e)
         return "⚠️ Could not fetch status. Try again later."
@@ -305,24 +451,7 @@ async def _build_status_message() -> str:
 async def _build_narratives_message() -> str:
     """Build a list of active narratives."""
     try:
-        from engine.narrative_store import load_store, get_active_narratives
-        store = load_store()
-        active = get_active_narratives(store)
-
-        if not active:
-            return "No active narratives detected yet. Check back after the next pipeline run."
-
-        lines = ["📡 *Active Narratives*\n"]
-        for n in active[:15]:  # Cap at 15 to avoid message length limits
-            name = _escape_md(n.get("name", "?"))
-            conf = n.get("current_confidence", "?")
-            direction = n.get("current_direction", "?")
-            count = n.get("detection_count", 0)
-            emoji = {"HIGH": "🔴", "MEDIUM": "🟡", "LOW": "⚪"}.get(conf, "⚪")
-            lines.append(f"{emoji} *{name}*\n   {conf} | {direction} | seen {count}x")
-
-        lines.append(f"\n[View all on Radar]({RADAR_URL})")
-        return "\n".join(lines)
+        return await _cached_reply("narratives", _render_narratives_message)
     except Exception as e:
         logger.error("Narratives message error: %s", e)
         return "⚠️ Could not fetch narratives. Try again later."
@@ -3,7 +3,7 @@ import pytest
 from engine.narrative_store import (
     _canonical, _word_overlap, find_match, merge_narratives,
     get_active_narratives, get_recently_faded, get_active_narrative_hints,
-    store_entry_to_api, _dedup_signals, load_store,
+    store_entry_to_api, _dedup_signals, load_store, _NameIndex,
 )
 from datetime import datetime, timezone, timedelta
 
@@ -48,6 +48,16 @@ class TestFindMatch:
         }}
         assert find_match("liquid staking expansion", store) is None
 
+    def test_index_matches_full_scan(self):
+        store = {"narratives": {
+            "abc": {"canonical_name": "ai trading bots"},
+            "def": {"canonical_name": "ai agents"},
+            "ghi": {"canonical_name": "liquid staking expansion"},
+        }}
+        index = _NameIndex(store["narratives"])
+        for query in ("ai enhanced trading bots", "ai agents", "liquid staking", "meme coins"):
+            assert find_match(query, store, index=index) == find_match(query, store)
+
 
 class TestMergeNarratives:
     def _make_narrative(self, name, confidence="HIGH", signals=None):
@@ -1,5 +1,8 @@
 """Tests for the signal scoring engine"""
 import pytest
+from unittest.mock import patch
+
+from engine import scorer
 from engine.scorer import score_signals, extract_topics, calculate_velocity, calculate_authority, calculate_novelty
 
 
@@ -29,6 +32,12 @@ class TestExtractTopics:
         topics = extract_topics({})
         assert topics == ["other"]
 
+    def test_overlapping_keywords(self):
+        """A keyword nested inside another still counts for its own topic."""
+        signal = {"name": "Chatbot launch"}
+        topics = extract_topics(signal)
+        assert topics == ["ai_agents", "social"]
+
 
 class TestCalculateVelocity:
     def test_high_star_github(self):
@@ -51,6 +60,11 @@ class TestCalculateVelocity:
         score = calculate_velocity(signal)
         assert score >= 80
 
+    def test_star_thresholds_are_strict(self):
+        """Hitting a threshold exactly stays in the lower tier."""
+        assert calculate_velocity({"source": "github", "stars": 100}) == 62
+        assert calculate_velocity({"source": "github", "stars": 101}) == 70
+
     def test_baseline(self):
         signal = {"source": "unknown"}
         score = calculate_velocity(signal)
@@ -64,6 +78,22 @@ class TestCalculateVelocity:
         score = calculate_velocity(signal, signals_by_date, {}, [], today)
         assert score > calculate_velocity(signal)
 
+    def test_precomputed_boosts_match_date_maps(self):
+        """Per-run precomputed boosts should score the same as raw date maps."""
+        signal = {"source": "github", "stars": 10}
+        today = "2026-02-13"
+        signals_by_date = {today: 20, "2026-02-12": 5, "2026-02-11": 5}
+        topic_by_date = {"defi": {today: 9, "2026-02-12": 1, "2026-02-11": 1}}
+        raw = calculate_velocity(signal, signals_by_date, topic_by_date, ["defi"], today)
+        precomputed = calculate_velocity(signal, topics=["defi"], acceleration=15, topic_boosts={"defi": 15})
+        assert raw == precomputed == 80
+
+    def test_dispatches_through_source_table(self):
+        """The source bonus is looked up once in the per-source handler table."""
+        signal = {"source": "github", "stars": 200}
+        with patch.dict(scorer._VELOCITY_BY_SOURCE, {"github": lambda signal: 7}):
+            assert calculate_velocity(signal) == 57  # 50 baseline + patched bonus
+
 
 class TestCalculateAuthority:
     def test_onchain_high_authority(self):
@@ -104,6 +134,12 @@ class TestCalculateAuthority:
         score = calculate_authority(signal)
         assert score >= 80  # 70 + 15 KOL boost
 
+    def test_dispatches_through_source_table(self):
+        """Authority comes from the per-source handler table, KOL boost included."""
+        signal = {"source": "twitter", "author": "rajgokal", "engagement_score": 100}
+        with patch.dict(scorer._AUTHORITY_BY_SOURCE, {"twitter": lambda signal, now: 42}):
+            assert calculate_authority(signal) == 42
+
 
 class TestScoreSignals:
     def test_sorts_by_score_descending(self):
@@ -154,3 +190,10 @@ class TestCalculateNovelty:
         signal = {"signal_type": "new_repo"}
         score = calculate_novelty(signal)
         assert score > 50
+
+    def test_age_measured_against_given_now(self):
+        from datetime import datetime, timezone
+        now = datetime(2026, 2, 20, tzinfo=timezone.utc)
+        assert calculate_novelty({"created_at": "2026-02-18T00:00:00Z"}, now) == 90
+        # Naive timestamps are treated as UTC
+        assert calculate_novelty({"created_at": "2026-01-01T00:00:00"}, now) == 30